@@ -1,15 +1,29 @@
+import asyncio
+import concurrent.futures
+import contextvars
+import hashlib
 import logging
 import os
 import re
+import threading
+import time
 import uuid
+from collections import defaultdict
 from collections.abc import Generator
+from functools import lru_cache
 from pathlib import Path
 
 import mlflow
+import orjson
 from mlflow.entities import SpanType
 from mlflow.genai.agent_server import invoke as invoke_decorator
+from pydantic import TypeAdapter
 
-from agent_server.checklist_parser import get_checklist_items_for_section, SECTIONS
+from agent_server.checklist_parser import (
+    get_checklist_items_for_section,
+    SECTION_PATHS,
+    SECTIONS,
+)
 from agent_server.ingest import get_serialized_space
 from agent_server.llm_utils import call_serving_endpoint, get_llm_model, parse_json_from_llm_response
 from agent_server.models import (
@@ -20,7 +34,10 @@ from agent_server.models import (
     SectionAnalysis,
     SynthesisResult,
 )
-from agent_server.prompts import get_checklist_evaluation_prompt
+from agent_server.prompts import (
+    get_batched_checklist_evaluation_messages,
+    get_checklist_evaluation_messages,
+)
 from agent_server.synthesizer import synthesize_analysis
 
 logger = logging.getLogger(__name__)
@@ -45,12 +62,122 @@ else:
     mlflow.tracing.disable()
 
 
+# Section count, fixed at import (SECTIONS never changes at runtime)
+_TOTAL_SECTIONS = len(SECTIONS)
+
+# Human-readable descriptions for each section, built once at import so the
+# missing-section path doesn't reconstruct the mapping on every call
+_SECTION_DESCRIPTIONS = {
+    "data_sources.tables": "Tables are required for the space to query data",
+    "data_sources.metric_views": "Metric views provide pre-computed aggregations for better accuracy",
+    "instructions.text_instructions": "Text instructions help Genie understand business context and terminology",
+    "instructions.example_question_sqls": "Example SQL queries teach Genie complex query patterns",
+    "instructions.sql_functions": "SQL functions register custom UDFs for specialized calculations",
+    "instructions.join_specs": "Join specifications help Genie correctly join tables",
+    "instructions.sql_snippets.filters": "Filter snippets define common filtering patterns (e.g., 'last quarter')",
+    "instructions.sql_snippets.expressions": "Expression snippets define common categorizations or derivations",
+    "instructions.sql_snippets.measures": "Measure snippets define standard business metrics",
+    "benchmarks.questions": "Benchmark questions help evaluate and improve Genie accuracy",
+}
+
+
+# Validates LLM finding lists in pydantic's compiled core, amortizing
+# schema resolution across calls instead of per-item Finding(**f) unpacking
+_FINDINGS_ADAPTER = TypeAdapter(list[Finding])
+
+# Finished analyses cached by (space_id, content hash): re-analyzing an
+# unchanged space (common while iterating in the frontend) re-runs every
+# LLM call for an identical result. Keying on the content hash means any
+# edit to the space misses naturally; the TTL bounds staleness of the
+# checklist/prompt side of the inputs.
+_ANALYSIS_CACHE_TTL = float(os.environ.get("ANALYSIS_CACHE_TTL_SECONDS", "600"))
+_ANALYSIS_CACHE_MAX = 128
+_analysis_cache: dict[tuple[str, str], tuple[float, AgentOutput]] = {}
+_analysis_cache_lock = threading.Lock()
+
+
+def _space_content_hash(space: dict) -> str:
+    """Stable digest of a serialized space's content."""
+    return hashlib.blake2b(
+        orjson.dumps(space, option=orjson.OPT_SORT_KEYS), digest_size=16
+    ).hexdigest()
+
+
+def invalidate_analysis_cache(genie_space_id: str | None = None) -> None:
+    """Evict cached analyses (all of them if no ID is given)."""
+    with _analysis_cache_lock:
+        if genie_space_id is None:
+            _analysis_cache.clear()
+        else:
+            for key in [k for k in _analysis_cache if k[0] == genie_space_id]:
+                del _analysis_cache[key]
+
+
+@lru_cache(maxsize=None)
+def _missing_section_analysis(section_name: str) -> SectionAnalysis:
+    """Build the (static) analysis for an unconfigured section."""
+    description = _SECTION_DESCRIPTIONS.get(
+        section_name, f"The {section_name} section is not configured"
+    )
+
+    # Create checklist items for missing section (all fail)
+    checklist_items = get_checklist_items_for_section(section_name)
+    checklist = [
+        ChecklistItem(
+            id=item["id"],
+            description=item["description"],
+            passed=False,
+            details="Section not configured",
+        )
+        for item in checklist_items
+    ]
+
+    # Calculate score based on checklist
+    passed_count = sum(1 for item in checklist if item.passed)
+    total_count = len(checklist)
+    score = round(passed_count / total_count * 10) if total_count > 0 else 0
+
+    finding = Finding(
+        category="suggestion",
+        severity="medium",
+        description=f"Section '{section_name}' is not configured",
+        recommendation=f"Consider adding {section_name}. {description}.",
+        reference=f"See checklist documentation for {section_name}",
+    )
+
+    return SectionAnalysis(
+        section_name=section_name,
+        checklist=checklist,
+        findings=[finding],
+        score=score,
+        summary=f"This section is not configured. {description}.",
+    )
+
+
+def _count_findings(analyses: list[SectionAnalysis]) -> tuple[int, dict[str, int]]:
+    """Accumulate finding total and per-severity counts in one pass."""
+    total = 0
+    counts = {"high": 0, "medium": 0, "low": 0}
+    for analysis in analyses:
+        total += len(analysis.findings)
+        for finding in analysis.findings:
+            if finding.severity in counts:
+                counts[finding.severity] += 1
+    return total, counts
+
+
 class GenieSpaceAnalyzer:
     """Analyzes Genie Space configurations against best practices."""
 
     def __init__(self):
         self.model = get_llm_model()
         self._session_id: str | None = None
+        # Bound concurrent serving-endpoint calls so the async fan-out
+        # doesn't trip the endpoint's rate limits (429s erase the win).
+        # threading.Semaphore because sections run in worker threads.
+        self._llm_semaphore = threading.Semaphore(
+            int(os.environ.get("LLM_MAX_CONCURRENCY", "6"))
+        )
 
     def start_session(self) -> str:
         """Start a new analysis session and return the session ID."""
@@ -63,7 +190,9 @@ class GenieSpaceAnalyzer:
 
     def _get_section_data(self, space: dict, section_path: str) -> dict | list | None:
         """Extract a section from the Genie space by dot-notation path."""
-        parts = section_path.split(".")
+        # Known sections have pre-split path tuples; fall back to splitting
+        # for ad-hoc paths
+        parts = SECTION_PATHS.get(section_path) or section_path.split(".")
         current = space
         for part in parts:
             if isinstance(current, dict) and part in current:
@@ -77,6 +206,11 @@ class GenieSpaceAnalyzer:
     ) -> SectionAnalysis:
         """Create analysis for a missing/unconfigured section.
 
+        The result depends only on the section name (the checklist and
+        wording are static), so it is memoized — unconfigured sections are
+        common and rebuilding the pydantic objects per request is wasted
+        work. Callers treat analyses as read-only.
+
         Args:
             section_name: Name of the missing section
             full_space: The full space data for cross-section checks
@@ -84,56 +218,7 @@ class GenieSpaceAnalyzer:
         Returns:
             SectionAnalysis with a low score and finding for the missing section
         """
-        # Human-readable descriptions for each section
-        section_descriptions = {
-            "data_sources.tables": "Tables are required for the space to query data",
-            "data_sources.metric_views": "Metric views provide pre-computed aggregations for better accuracy",
-            "instructions.text_instructions": "Text instructions help Genie understand business context and terminology",
-            "instructions.example_question_sqls": "Example SQL queries teach Genie complex query patterns",
-            "instructions.sql_functions": "SQL functions register custom UDFs for specialized calculations",
-            "instructions.join_specs": "Join specifications help Genie correctly join tables",
-            "instructions.sql_snippets.filters": "Filter snippets define common filtering patterns (e.g., 'last quarter')",
-            "instructions.sql_snippets.expressions": "Expression snippets define common categorizations or derivations",
-            "instructions.sql_snippets.measures": "Measure snippets define standard business metrics",
-            "benchmarks.questions": "Benchmark questions help evaluate and improve Genie accuracy",
-        }
-
-        description = section_descriptions.get(
-            section_name, f"The {section_name} section is not configured"
-        )
-
-        # Create checklist items for missing section (all fail)
-        checklist_items = get_checklist_items_for_section(section_name)
-        checklist = [
-            ChecklistItem(
-                id=item["id"],
-                description=item["description"],
-                passed=False,
-                details="Section not configured",
-            )
-            for item in checklist_items
-        ]
-
-        # Calculate score based on checklist
-        passed_count = sum(1 for item in checklist if item.passed)
-        total_count = len(checklist)
-        score = round(passed_count / total_count * 10) if total_count > 0 else 0
-
-        finding = Finding(
-            category="suggestion",
-            severity="medium",
-            description=f"Section '{section_name}' is not configured",
-            recommendation=f"Consider adding {section_name}. {description}.",
-            reference=f"See checklist documentation for {section_name}",
-        )
-
-        return SectionAnalysis(
-            section_name=section_name,
-            checklist=checklist,
-            findings=[finding],
-            score=score,
-            summary=f"This section is not configured. {description}.",
-        )
+        return _missing_section_analysis(section_name)
 
     @mlflow.trace(span_type=SpanType.LLM)
     def analyze_section(
@@ -152,8 +237,9 @@ class GenieSpaceAnalyzer:
         Returns:
             SectionAnalysis with checklist items, findings and score
         """
-        # Handle missing sections
-        if section_data is None:
+        # Handle missing or empty sections locally — an LLM round trip adds
+        # nothing when there is no data to evaluate
+        if not section_data:
             return self._create_missing_section_analysis(section_name, full_space)
 
         # Tag trace with session ID if there's an active trace
@@ -169,40 +255,67 @@ class GenieSpaceAnalyzer:
 
         # Get all checklist items for this section
         checklist_items = get_checklist_items_for_section(section_name)
-        checklist = []
-        findings = []
 
         if checklist_items:
             # Call LLM to evaluate all items
-            prompt = get_checklist_evaluation_prompt(
+            messages = get_checklist_evaluation_messages(
                 section_name, section_data, checklist_items
             )
 
-            content = call_serving_endpoint(
-                messages=[{"role": "user", "content": prompt}],
-                model=self.model,
-            )
+            with self._llm_semaphore:
+                content = call_serving_endpoint(
+                    messages=messages,
+                    model=self.model,
+                    stream=True,
+                    # Cap decode cost and keep output as raw JSON
+                    max_tokens=1500,
+                    response_format={"type": "json_object"},
+                )
 
             result = parse_json_from_llm_response(content)
+            return self._build_section_analysis(section_name, checklist_items, result)
 
-            # Process LLM evaluations into ChecklistItems
-            evaluations = {e["id"]: e for e in result.get("evaluations", [])}
-            for item in checklist_items:
-                eval_result = evaluations.get(item["id"], {})
-                checklist.append(
-                    ChecklistItem(
-                        id=item["id"],
-                        description=item["description"],
-                        passed=eval_result.get("passed", False),
-                        details=eval_result.get("details"),
-                    )
+        return SectionAnalysis(
+            section_name=section_name,
+            checklist=[],
+            findings=[],
+            score=0,
+            summary="No checklist items defined for this section.",
+        )
+
+    def _build_section_analysis(
+        self,
+        section_name: str,
+        checklist_items: list[dict],
+        result: dict,
+    ) -> SectionAnalysis:
+        """Build a SectionAnalysis from an LLM evaluation result dict.
+
+        Args:
+            section_name: Name of the evaluated section
+            checklist_items: The checklist items that were evaluated
+            result: Parsed LLM response with evaluations/findings/summary keys
+
+        Returns:
+            SectionAnalysis with checklist items, findings and score
+        """
+        # Process LLM evaluations into ChecklistItems
+        evaluations = {e["id"]: e for e in result.get("evaluations", [])}
+        checklist = []
+        for item in checklist_items:
+            eval_result = evaluations.get(item["id"], {})
+            checklist.append(
+                ChecklistItem(
+                    id=item["id"],
+                    description=item["description"],
+                    passed=eval_result.get("passed", False),
+                    details=eval_result.get("details"),
                 )
+            )
 
-            # Get findings from LLM response
-            findings = [Finding(**f) for f in result.get("findings", [])]
-            summary = result.get("summary", "")
-        else:
-            summary = "No checklist items defined for this section."
+        # Get findings from LLM response
+        findings = _FINDINGS_ADAPTER.validate_python(result.get("findings", []))
+        summary = result.get("summary", "")
 
         # Calculate score based on checklist items
         passed_count = sum(1 for item in checklist if item.passed)
@@ -217,82 +330,223 @@ class GenieSpaceAnalyzer:
             summary=summary,
         )
 
-    @mlflow.trace(name="predict", span_type=SpanType.AGENT)
-    def predict(self, inputs: list[AgentInput]) -> list[AgentOutput]:
-        """Main entry point for the agent."""
-        self.start_session()
-        try:
-            outputs = []
+    @mlflow.trace(span_type=SpanType.LLM)
+    def analyze_sections_batched(
+        self,
+        sections: list[tuple[str, dict | list | None]],
+        full_space: dict | None = None,
+    ) -> list[SectionAnalysis]:
+        """Analyze several sections with a single LLM call.
 
-            for agent_input in inputs:
-                genie_space_id = agent_input.genie_space_id
+        Sections share one prompt (identified by [index]) so the instruction
+        preamble is sent once per batch instead of once per section.
+        Missing sections and sections without checklist items are handled
+        locally without hitting the LLM.
 
-                # Fetch the Genie space
-                with mlflow.start_span(name="fetch_genie_space") as span:
-                    span.set_inputs({"genie_space_id": genie_space_id})
-                    space = get_serialized_space(genie_space_id)
-                    span.set_outputs({"keys": list(space.keys())})
+        Args:
+            sections: List of (section_name, section_data) tuples
+            full_space: The full space data for cross-section checks
 
-                # Analyze each section sequentially
-                analyses = []
-                total_score = 0
-                section_count = 0
+        Returns:
+            List of SectionAnalysis in the same order as the input sections
+        """
+        analyses: dict[str, SectionAnalysis] = {}
+        llm_sections: list[tuple[str, dict | list, list[dict]]] = []
+
+        for section_name, section_data in sections:
+            # Missing and empty sections are resolved without an LLM call
+            if not section_data:
+                analyses[section_name] = self._create_missing_section_analysis(
+                    section_name, full_space
+                )
+                continue
+
+            checklist_items = get_checklist_items_for_section(section_name)
+            if not checklist_items:
+                analyses[section_name] = SectionAnalysis(
+                    section_name=section_name,
+                    checklist=[],
+                    findings=[],
+                    score=0,
+                    summary="No checklist items defined for this section.",
+                )
+            else:
+                llm_sections.append((section_name, section_data, checklist_items))
 
-                for section_name in SECTIONS:
-                    section_data = self._get_section_data(space, section_name)
+        if llm_sections:
+            try:
+                messages = get_batched_checklist_evaluation_messages(llm_sections)
+
+                with self._llm_semaphore:
+                    content = call_serving_endpoint(
+                        messages=messages,
+                        model=self.model,
+                        stream=True,
+                        # Output budget scales with batch size; json_object mode
+                        # keeps the response parseable without fence stripping
+                        max_tokens=1500 * len(llm_sections),
+                        response_format={"type": "json_object"},
+                    )
 
-                    # Analyze ALL sections (including missing ones)
-                    with mlflow.start_span(name=f"analyze_{section_name}") as span:
-                        span.set_inputs({"section_name": section_name})
-                        analysis = self.analyze_section(
-                            section_name, section_data, full_space=space
+                result = parse_json_from_llm_response(content)
+                results_by_index = {
+                    r.get("index"): r for r in result.get("results", [])
+                }
+                for index, (section_name, section_data, checklist_items) in enumerate(
+                    llm_sections, 1
+                ):
+                    section_result = results_by_index.get(index)
+                    if section_result is None:
+                        # A parseable response can still drop a section; an
+                        # empty result would read as an all-fail checklist,
+                        # so re-analyze that section individually instead
+                        logger.warning(
+                            f"Batched evaluation response is missing section "
+                            f"{index} ({section_name}); falling back to a "
+                            f"per-section call"
                         )
-                        analyses.append(analysis)
-                        total_score += analysis.score
-                        section_count += 1
-                        span.set_outputs(
-                            {
-                                "score": analysis.score,
-                                "findings_count": len(analysis.findings),
-                                "checklist_passed": sum(
-                                    1 for c in analysis.checklist if c.passed
-                                ),
-                                "checklist_total": len(analysis.checklist),
-                            }
+                        analyses[section_name] = self.analyze_section(
+                            section_name, section_data, full_space=full_space
                         )
+                        continue
+                    analyses[section_name] = self._build_section_analysis(
+                        section_name, checklist_items, section_result
+                    )
+            except (RuntimeError, ValueError) as e:
+                # Batched output is a single JSON document; a malformed
+                # response (or endpoint error) would otherwise sink the whole
+                # batch. Fall back to per-section calls so one bad response
+                # costs extra round-trips, not the analysis.
+                logger.warning(
+                    f"Batched evaluation of {len(llm_sections)} section(s) "
+                    f"failed ({e}); falling back to per-section calls"
+                )
+                for section_name, section_data, _ in llm_sections:
+                    analyses[section_name] = self.analyze_section(
+                        section_name, section_data, full_space=full_space
+                    )
 
-                # Run cross-sectional synthesis (full analysis = all 10 sections)
-                is_full_analysis = section_count == len(SECTIONS)
-                synthesis = None
-                if is_full_analysis:
-                    with mlflow.start_span(name="synthesize") as span:
-                        synthesis = synthesize_analysis(analyses, is_full_analysis)
-                        span.set_outputs({
-                            "assessment": synthesis.assessment.value,
-                            "compensating_strengths_count": len(synthesis.compensating_strengths),
-                        })
+        return [analyses[section_name] for section_name, _ in sections]
 
-                overall_score = total_score // section_count if section_count > 0 else 0
-                trace_id = (
-                    mlflow.get_current_active_span().request_id
-                    if mlflow.get_current_active_span()
-                    else ""
-                )
+    async def _predict_one(self, agent_input: AgentInput) -> AgentOutput:
+        """Analyze a single Genie space: fetch, fan out sections, synthesize."""
+        genie_space_id = agent_input.genie_space_id
 
-                outputs.append(
-                    AgentOutput(
-                        genie_space_id=genie_space_id,
-                        analyses=analyses,
-                        synthesis=synthesis,
-                        overall_score=overall_score,
-                        trace_id=trace_id,
-                    )
+        # Fetch the Genie space. Span metadata is gated on the tracing flag:
+        # without an experiment the serialization work is pure overhead.
+        with mlflow.start_span(name="fetch_genie_space") as span:
+            if _mlflow_tracing_enabled:
+                span.set_inputs({"genie_space_id": genie_space_id})
+            space = await asyncio.to_thread(
+                get_serialized_space, genie_space_id
+            )
+            if _mlflow_tracing_enabled:
+                span.set_outputs({"keys": list(space.keys())})
+
+        # Unchanged space content → reuse the finished analysis
+        cache_key = (genie_space_id, _space_content_hash(space))
+        now = time.monotonic()
+        with _analysis_cache_lock:
+            entry = _analysis_cache.get(cache_key)
+        if entry is not None and now - entry[0] < _ANALYSIS_CACHE_TTL:
+            logger.info(f"Serving analysis for {genie_space_id} from cache")
+            trace_id = (
+                mlflow.get_current_active_span().request_id
+                if mlflow.get_current_active_span()
+                else ""
+            )
+            return entry[1].model_copy(update={"trace_id": trace_id})
+
+        # Fan out all sections (including missing ones) concurrently,
+        # batching a few sections per LLM call to amortize the shared
+        # prompt preamble. asyncio.to_thread copies the current
+        # context, so the OBO token ContextVar propagates into each
+        # worker thread.
+        batch_size = max(
+            1, int(os.environ.get("LLM_SECTION_BATCH_SIZE", "3"))
+        )
+        all_sections = self.get_all_sections(space)
+        batches = [
+            all_sections[i : i + batch_size]
+            for i in range(0, len(all_sections), batch_size)
+        ]
+        tasks = [
+            asyncio.to_thread(
+                self.analyze_sections_batched, batch, space
+            )
+            for batch in batches
+        ]
+        batch_results = await asyncio.gather(*tasks)
+        analyses = [a for batch in batch_results for a in batch]
+        total_score = sum(a.score for a in analyses)
+        section_count = len(analyses)
+
+        # Run cross-sectional synthesis (full analysis = all 10 sections)
+        is_full_analysis = section_count == _TOTAL_SECTIONS
+        synthesis = None
+        if is_full_analysis:
+            with mlflow.start_span(name="synthesize") as span:
+                synthesis = await asyncio.to_thread(
+                    synthesize_analysis, analyses, is_full_analysis
                 )
+                if _mlflow_tracing_enabled:
+                    span.set_outputs({
+                        "assessment": synthesis.assessment.value,
+                        "compensating_strengths_count": len(synthesis.compensating_strengths),
+                    })
+
+        overall_score = total_score // section_count if section_count > 0 else 0
+        trace_id = (
+            mlflow.get_current_active_span().request_id
+            if mlflow.get_current_active_span()
+            else ""
+        )
 
-            return outputs
+        total_findings, severity_counts = _count_findings(analyses)
+        output = AgentOutput(
+            genie_space_id=genie_space_id,
+            analyses=analyses,
+            synthesis=synthesis,
+            overall_score=overall_score,
+            trace_id=trace_id,
+            total_findings=total_findings,
+            severity_counts=severity_counts,
+        )
+
+        with _analysis_cache_lock:
+            if len(_analysis_cache) >= _ANALYSIS_CACHE_MAX:
+                del _analysis_cache[
+                    min(_analysis_cache, key=lambda k: _analysis_cache[k][0])
+                ]
+            _analysis_cache[cache_key] = (now, output)
+        return output
+
+    @mlflow.trace(name="predict", span_type=SpanType.AGENT)
+    async def predict_async(self, inputs: list[AgentInput]) -> list[AgentOutput]:
+        """Async entry point for the agent.
+
+        Section analyses are independent and I/O-bound on the serving
+        endpoint, so they are dispatched concurrently with asyncio.gather
+        instead of sequentially — wall time becomes roughly the slowest
+        section instead of the sum of all sections. The same applies one
+        level up: when multiple spaces are requested, each space's
+        pipeline runs concurrently too, with the shared semaphore still
+        capping total in-flight LLM calls.
+        """
+        self.start_session()
+        try:
+            return list(
+                await asyncio.gather(
+                    *[self._predict_one(agent_input) for agent_input in inputs]
+                )
+            )
         finally:
             self.end_session()
 
+    def predict(self, inputs: list[AgentInput]) -> list[AgentOutput]:
+        """Synchronous entry point — wraps predict_async in a new event loop."""
+        return asyncio.run(self.predict_async(inputs))
+
     def get_sections_with_data(self, space: dict) -> list[tuple[str, dict | list]]:
         """Get list of sections that have data in the space.
 
@@ -302,12 +556,11 @@ class GenieSpaceAnalyzer:
         Returns:
             List of (section_name, section_data) tuples for sections with data only
         """
-        sections_with_data = []
-        for section_name in SECTIONS:
-            section_data = self._get_section_data(space, section_name)
-            if section_data is not None:
-                sections_with_data.append((section_name, section_data))
-        return sections_with_data
+        return [
+            (section_name, section_data)
+            for section_name, section_data in self.get_all_sections(space)
+            if section_data is not None
+        ]
 
     def get_all_sections(self, space: dict) -> list[tuple[str, dict | list | None]]:
         """Get all sections with their data (or None if missing).
@@ -346,58 +599,81 @@ class GenieSpaceAnalyzer:
         with mlflow.start_span(
             name="predict_streaming", span_type=SpanType.AGENT
         ) as root_span:
-            root_span.set_inputs({"genie_space_id": genie_space_id})
+            if _mlflow_tracing_enabled:
+                root_span.set_inputs({"genie_space_id": genie_space_id})
 
             try:
                 # Fetch the Genie space
                 yield {"status": "fetching", "message": "Fetching Genie space..."}
                 with mlflow.start_span(name="fetch_genie_space") as span:
-                    span.set_inputs({"genie_space_id": genie_space_id})
+                    if _mlflow_tracing_enabled:
+                        span.set_inputs({"genie_space_id": genie_space_id})
                     space = get_serialized_space(genie_space_id)
-                    span.set_outputs({"keys": list(space.keys())})
+                    if _mlflow_tracing_enabled:
+                        span.set_outputs({"keys": list(space.keys())})
 
                 # Determine which sections to analyze
                 sections_to_analyze = selected_sections if selected_sections else SECTIONS
                 is_full_analysis = set(sections_to_analyze) == set(SECTIONS)
 
-                # Analyze each section sequentially (including missing sections)
-                analyses = []
-                total_score = 0
-                section_count = 0
+                # Analyze sections concurrently (including missing ones) and
+                # yield progress in completion order, so the first update
+                # arrives after the fastest section instead of the sum of
+                # all earlier sections
                 total_sections = len(sections_to_analyze)
 
-                # Prepare sections with their data (None for missing sections)
-                all_sections = [
-                    (name, self._get_section_data(space, name)) for name in sections_to_analyze
-                ]
-
-                for i, (section_name, section_data) in enumerate(all_sections, 1):
-                    yield {
-                        "status": "analyzing",
-                        "section": section_name,
-                        "current": i,
-                        "total": total_sections,
-                        "message": f"Analyzing {section_name}...",
+                # Prepare sections with their data (None for missing
+                # sections), resolving each path exactly once via the
+                # shared helper
+                if selected_sections:
+                    all_sections = [
+                        (name, self._get_section_data(space, name))
+                        for name in selected_sections
+                    ]
+                else:
+                    all_sections = self.get_all_sections(space)
+
+                analyses_by_name: dict[str, SectionAnalysis] = {}
+                max_workers = min(
+                    total_sections,
+                    int(os.environ.get("LLM_MAX_CONCURRENCY", "6")),
+                ) or 1
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=max_workers
+                ) as executor:
+                    # Executor threads don't inherit this thread's context;
+                    # copy it per task so the OBO token ContextVar and the
+                    # active mlflow span propagate (see CLAUDE.md gotcha)
+                    futures = {
+                        executor.submit(
+                            contextvars.copy_context().run,
+                            self.analyze_section,
+                            section_name,
+                            section_data,
+                            space,
+                        ): section_name
+                        for section_name, section_data in all_sections
                     }
 
-                    with mlflow.start_span(name=f"analyze_{section_name}") as span:
-                        span.set_inputs({"section_name": section_name})
-                        analysis = self.analyze_section(
-                            section_name, section_data, full_space=space
-                        )
-                        analyses.append(analysis)
-                        total_score += analysis.score
-                        section_count += 1
-                        span.set_outputs(
-                            {
-                                "score": analysis.score,
-                                "findings_count": len(analysis.findings),
-                                "checklist_passed": sum(
-                                    1 for c in analysis.checklist if c.passed
-                                ),
-                                "checklist_total": len(analysis.checklist),
-                            }
-                        )
+                    completed = 0
+                    for future in concurrent.futures.as_completed(futures):
+                        section_name = futures[future]
+                        analyses_by_name[section_name] = future.result()
+                        completed += 1
+                        yield {
+                            "status": "analyzing",
+                            "section": section_name,
+                            "current": completed,
+                            "total": total_sections,
+                            "message": f"Analyzed {section_name}",
+                        }
+
+                # Preserve the configured section order in the output
+                analyses = [
+                    analyses_by_name[name] for name, _ in all_sections
+                ]
+                total_score = sum(a.score for a in analyses)
+                section_count = len(analyses)
 
                 # Run cross-sectional synthesis (only for full analysis)
                 synthesis = None
@@ -405,10 +681,11 @@ class GenieSpaceAnalyzer:
                     yield {"status": "synthesizing", "message": "Synthesizing cross-sectional insights..."}
                     with mlflow.start_span(name="synthesize") as span:
                         synthesis = synthesize_analysis(analyses, is_full_analysis)
-                        span.set_outputs({
-                            "assessment": synthesis.assessment.value,
-                            "compensating_strengths_count": len(synthesis.compensating_strengths),
-                        })
+                        if _mlflow_tracing_enabled:
+                            span.set_outputs({
+                                "assessment": synthesis.assessment.value,
+                                "compensating_strengths_count": len(synthesis.compensating_strengths),
+                            })
 
                 overall_score = total_score // section_count if section_count > 0 else 0
                 trace_id = root_span.request_id if root_span else None
@@ -416,20 +693,24 @@ class GenieSpaceAnalyzer:
                 yield {"status": "complete", "message": "Analysis complete!"}
 
                 # Set outputs on root span
-                root_span.set_outputs(
-                    {
-                        "overall_score": overall_score,
-                        "sections_analyzed": section_count,
-                        "is_full_analysis": is_full_analysis,
-                    }
-                )
+                if _mlflow_tracing_enabled:
+                    root_span.set_outputs(
+                        {
+                            "overall_score": overall_score,
+                            "sections_analyzed": section_count,
+                            "is_full_analysis": is_full_analysis,
+                        }
+                    )
 
+                total_findings, severity_counts = _count_findings(analyses)
                 return AgentOutput(
                     genie_space_id=genie_space_id,
                     analyses=analyses,
                     synthesis=synthesis,
                     overall_score=overall_score,
                     trace_id=trace_id or "",
+                    total_findings=total_findings,
+                    severity_counts=severity_counts,
                 )
             finally:
                 self.end_session()
@@ -437,6 +718,9 @@ class GenieSpaceAnalyzer:
 
 OUTPUT_DIR = Path(__file__).parent.parent / "output"
 
+# Characters not allowed in output filenames
+_UNSAFE_FILENAME_RE = re.compile(r"[^a-zA-Z0-9\-_.]")
+
 
 def _sanitize_filename(name: str) -> str:
     """Sanitize a string for use in filenames.
@@ -444,7 +728,7 @@ def _sanitize_filename(name: str) -> str:
     Allows only alphanumeric characters, hyphens, underscores, and dots.
     Replaces any other characters with underscores.
     """
-    return re.sub(r"[^a-zA-Z0-9\-_.]", "_", name)
+    return _UNSAFE_FILENAME_RE.sub("_", name)
 
 
 def _format_section_name(section_name: str) -> str:
@@ -452,102 +736,101 @@ def _format_section_name(section_name: str) -> str:
     return section_name.replace("_", " ").replace(".", " → ").title()
 
 
-def format_analysis_as_markdown(output: AgentOutput) -> str:
-    """Convert analysis output to a formatted markdown document.
+# Display names for the known sections, rendered once at import; ad-hoc
+# section names still go through _format_section_name
+_DISPLAY_NAMES = {s: _format_section_name(s) for s in SECTIONS}
 
-    Args:
-        output: The analysis output to format
 
-    Returns:
-        Formatted markdown string
-    """
-    lines = []
+def _iter_markdown_lines(output: AgentOutput) -> Generator[str, None, None]:
+    """Yield the report lines for an analysis output one at a time.
 
+    Generating lines lazily and joining once avoids growing an
+    intermediate list via repeated .append calls.
+    """
     # Title
-    lines.append("# Genie Space Analysis Report")
-    lines.append("")
-    lines.append(f"**Space ID:** `{output.genie_space_id}`")
-    lines.append("")
+    yield "# Genie Space Analysis Report"
+    yield ""
+    yield f"**Space ID:** `{output.genie_space_id}`"
+    yield ""
 
     # Overall Score
-    lines.append("---")
-    lines.append("")
-    lines.append(f"## Overall Score: {output.overall_score}/10")
-    lines.append("")
-
-    # Summary Statistics
-    total_findings = sum(len(a.findings) for a in output.analyses)
-    high_count = sum(
-        1 for a in output.analyses for f in a.findings if f.severity == "high"
-    )
-    medium_count = sum(
-        1 for a in output.analyses for f in a.findings if f.severity == "medium"
-    )
-    low_count = sum(
-        1 for a in output.analyses for f in a.findings if f.severity == "low"
-    )
-
-    # Checklist statistics
-    total_checklist = sum(len(a.checklist) for a in output.analyses)
-    passed_checklist = sum(
-        1 for a in output.analyses for c in a.checklist if c.passed
-    )
-
-    lines.append("### Summary Statistics")
-    lines.append("")
-    lines.append(f"- **Checklist Items Passed:** {passed_checklist}/{total_checklist}")
-    lines.append(f"- **Total Findings:** {total_findings}")
-    lines.append(f"- **High Severity:** {high_count}")
-    lines.append(f"- **Medium Severity:** {medium_count}")
-    lines.append(f"- **Low Severity:** {low_count}")
-    lines.append(f"- **Sections Analyzed:** {len(output.analyses)}")
-    lines.append("")
+    yield "---"
+    yield ""
+    yield f"## Overall Score: {output.overall_score}/10"
+    yield ""
+
+    # Use finding aggregates precomputed during predict when present;
+    # fall back to one pass for outputs built elsewhere
+    if output.severity_counts:
+        total_findings = output.total_findings
+        severity_counts = output.severity_counts
+    else:
+        total_findings, severity_counts = _count_findings(output.analyses)
+
+    # Checklist statistics in a single pass
+    total_checklist = 0
+    passed_checklist = 0
+    for a in output.analyses:
+        total_checklist += len(a.checklist)
+        passed_checklist += sum(1 for c in a.checklist if c.passed)
+
+    yield "### Summary Statistics"
+    yield ""
+    yield f"- **Checklist Items Passed:** {passed_checklist}/{total_checklist}"
+    yield f"- **Total Findings:** {total_findings}"
+    yield f"- **High Severity:** {severity_counts['high']}"
+    yield f"- **Medium Severity:** {severity_counts['medium']}"
+    yield f"- **Low Severity:** {severity_counts['low']}"
+    yield f"- **Sections Analyzed:** {len(output.analyses)}"
+    yield ""
 
     # Section-by-section breakdown
-    lines.append("---")
-    lines.append("")
-    lines.append("## Section Analysis")
-    lines.append("")
+    yield "---"
+    yield ""
+    yield "## Section Analysis"
+    yield ""
 
     for analysis in output.analyses:
-        display_name = _format_section_name(analysis.section_name)
+        display_name = _DISPLAY_NAMES.get(
+            analysis.section_name
+        ) or _format_section_name(analysis.section_name)
 
         # Section header with score
-        lines.append(f"### {display_name}")
-        lines.append("")
+        yield f"### {display_name}"
+        yield ""
 
         # Checklist progress
         passed = sum(1 for c in analysis.checklist if c.passed)
         total = len(analysis.checklist)
-        lines.append(f"**Checklist:** {passed}/{total} items passed")
-        lines.append(f"**Score:** {analysis.score}/10")
-        lines.append("")
+        yield f"**Checklist:** {passed}/{total} items passed"
+        yield f"**Score:** {analysis.score}/10"
+        yield ""
 
         # Summary
         if analysis.summary:
-            lines.append(f"**Summary:** {analysis.summary}")
-            lines.append("")
+            yield f"**Summary:** {analysis.summary}"
+            yield ""
 
         # Checklist items
         if analysis.checklist:
-            lines.append("#### Checklist")
-            lines.append("")
+            yield "#### Checklist"
+            yield ""
             for item in analysis.checklist:
                 status = "✓" if item.passed else "✗"
                 details = f" - {item.details}" if item.details else ""
-                lines.append(f"- {status} {item.description}{details}")
-            lines.append("")
+                yield f"- {status} {item.description}{details}"
+            yield ""
 
         # Findings grouped by severity
         if analysis.findings:
-            lines.append("#### Findings")
-            lines.append("")
+            yield "#### Findings"
+            yield ""
 
-            # Group findings by severity
-            findings_by_severity = {"high": [], "medium": [], "low": []}
+            # Group findings by severity; only severities actually present
+            # get a bucket (unknown severities are dropped below)
+            findings_by_severity = defaultdict(list)
             for finding in analysis.findings:
-                if finding.severity in findings_by_severity:
-                    findings_by_severity[finding.severity].append(finding)
+                findings_by_severity[finding.severity].append(finding)
 
             severity_labels = {
                 "high": "🔴 High Severity",
@@ -555,27 +838,36 @@ def format_analysis_as_markdown(output: AgentOutput) -> str:
                 "low": "🔵 Low Severity",
             }
 
-            for severity in ["high", "medium", "low"]:
-                severity_findings = findings_by_severity[severity]
-                if severity_findings:
-                    lines.append(f"**{severity_labels[severity]}**")
-                    lines.append("")
-                    for finding in severity_findings:
-                        lines.append(f"- **{finding.description}**")
-                        lines.append(
-                            f"  - 💡 *Recommendation:* {finding.recommendation}"
-                        )
-                        if finding.reference:
-                            lines.append(f"  - 📚 *Reference:* {finding.reference}")
-                    lines.append("")
+            for severity in ("high", "medium", "low"):
+                severity_findings = findings_by_severity.get(severity)
+                if not severity_findings:
+                    continue
+                yield f"**{severity_labels[severity]}**"
+                yield ""
+                for finding in severity_findings:
+                    yield f"- **{finding.description}**"
+                    yield f"  - 💡 *Recommendation:* {finding.recommendation}"
+                    if finding.reference:
+                        yield f"  - 📚 *Reference:* {finding.reference}"
+                yield ""
         else:
-            lines.append("✅ No issues found in this section.")
-            lines.append("")
+            yield "✅ No issues found in this section."
+            yield ""
 
-        lines.append("---")
-        lines.append("")
+        yield "---"
+        yield ""
 
-    return "\n".join(lines)
+
+def format_analysis_as_markdown(output: AgentOutput) -> str:
+    """Convert analysis output to a formatted markdown document.
+
+    Args:
+        output: The analysis output to format
+
+    Returns:
+        Formatted markdown string
+    """
+    return "\n".join(_iter_markdown_lines(output))
 
 
 def save_analysis_output(output: AgentOutput) -> Path:
@@ -598,19 +890,34 @@ def save_analysis_output(output: AgentOutput) -> Path:
         raise ValueError("Invalid genie_space_id: path traversal detected")
 
     markdown_content = format_analysis_as_markdown(output)
-    filepath.write_text(markdown_content)
+
+    # Write to a unique temp file and rename into place: concurrent
+    # analyses of the same space never expose a half-written report, and
+    # os.replace is atomic on POSIX
+    tmp_path = filepath.with_name(f"{filepath.name}.tmp.{uuid.uuid4().hex}")
+    try:
+        tmp_path.write_text(markdown_content, encoding="utf-8")
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
     return filepath
 
 
 # Lazy initialization of the analyzer
 _analyzer: GenieSpaceAnalyzer | None = None
+_analyzer_lock = threading.Lock()
 
 
 def get_analyzer() -> GenieSpaceAnalyzer:
-    """Get or create the analyzer instance."""
+    """Get or create the analyzer instance (thread-safe)."""
     global _analyzer
     if _analyzer is None:
-        _analyzer = GenieSpaceAnalyzer()
+        # Double-checked so a concurrent first burst constructs exactly one
+        # instance; steady state never touches the lock
+        with _analyzer_lock:
+            if _analyzer is None:
+                _analyzer = GenieSpaceAnalyzer()
     return _analyzer
 
 
@@ -619,6 +926,7 @@ async def invoke(data: dict) -> dict:
     """Invoke function for the non-conversational agent."""
     analyzer = get_analyzer()
     input_obj = AgentInput(**data)
-    result = analyzer.predict([input_obj])[0]
-    save_analysis_output(result)
+    result = (await analyzer.predict_async([input_obj]))[0]
+    # Offload the markdown write so the event loop isn't blocked on disk I/O
+    await asyncio.to_thread(save_analysis_output, result)
     return result.model_dump()
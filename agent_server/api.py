@@ -5,19 +5,46 @@ Provides endpoints for the React frontend to fetch spaces, analyze sections,
 and stream analysis progress.
 """
 
-import json
+import asyncio
+import atexit
+import concurrent.futures
+import logging
+import os
+import time
+from datetime import datetime
 from pathlib import Path
 
-import logging
+from types import MappingProxyType
+from typing import Annotated
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
+import orjson
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
-from agent_server.agent import GenieSpaceAnalyzer, SECTIONS, get_analyzer
-from agent_server.ingest import get_serialized_space
+from agent_server.agent import (
+    GenieSpaceAnalyzer,
+    SECTIONS,
+    get_analyzer,
+    invalidate_analysis_cache,
+    save_analysis_output,
+)
+from agent_server.auth import (
+    get_databricks_host,
+    get_obo_token,
+    get_workspace_client,
+    is_running_on_databricks_apps,
+    set_obo_token,
+)
+from agent_server.error_analysis import auto_label_items
+from agent_server.genie_creator import create_genie_space as do_create_genie_space
+from agent_server.ingest import (
+    get_serialized_space,
+    invalidate_space_cache,
+    query_genie_for_sql,
+)
 from agent_server.models import (
     AgentInput,
     AgentOutput,
@@ -36,9 +63,46 @@ from agent_server.models import (
     SynthesisResult,
 )
 from agent_server.optimizer import get_optimizer
+from agent_server.sql_executor import execute_sql, get_sql_warehouse_id
 from agent_server.synthesizer import synthesize_analysis
 
-router = APIRouter(prefix="/api")
+# ORJSONResponse serializes responses in C instead of FastAPI's Python-level
+# jsonable_encoder walk — a real win for the large space/analysis payloads
+router = APIRouter(prefix="/api", default_response_class=ORJSONResponse)
+
+# Shared pool for optimization runs: a per-request single-worker executor
+# paid thread creation on every /optimize call and was never shut down.
+# One process-wide pool amortizes that and lets concurrent optimizations
+# actually run in parallel.
+_OPT_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=int(os.environ.get("OPT_WORKERS", "4")),
+    thread_name_prefix="optimizer",
+)
+atexit.register(_OPT_EXECUTOR.shutdown, wait=False)
+
+# Shared pool for /analyze/all section fan-out, sized to the same bound the
+# analyzer's LLM semaphore enforces
+_ANALYZE_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=int(os.environ.get("LLM_MAX_CONCURRENCY", "6")),
+    thread_name_prefix="analyze",
+)
+atexit.register(_ANALYZE_EXECUTOR.shutdown, wait=False)
+
+# Constructed eagerly: both singletons only read configuration, and binding
+# them here removes a call + lock-check per request
+_ANALYZER = get_analyzer()
+_OPTIMIZER = get_optimizer()
+
+
+# Generic client-facing error messages, keyed by status code (detailed
+# errors are only logged server-side)
+_GENERIC_ERROR_MESSAGES = MappingProxyType({
+    400: "Invalid request. Please check your input and try again.",
+    404: "The requested resource was not found.",
+    500: "An internal error occurred. Please try again later.",
+    504: "The operation timed out. Please try again.",
+})
+_DEFAULT_ERROR_MESSAGE = "An error occurred."
 
 
 def _safe_error(e: Exception, status_code: int, context: str) -> HTTPException:
@@ -46,26 +110,23 @@ def _safe_error(e: Exception, status_code: int, context: str) -> HTTPException:
 
     Logs detailed error server-side but returns generic message to client.
     """
-    logger.exception(f"{context}: {e}")
+    logger.exception("%s: %s", context, e)
+    message = _GENERIC_ERROR_MESSAGES.get(status_code, _DEFAULT_ERROR_MESSAGE)
+    return HTTPException(status_code=status_code, detail=message)
 
-    generic_messages = {
-        400: "Invalid request. Please check your input and try again.",
-        404: "The requested resource was not found.",
-        500: "An internal error occurred. Please try again later.",
-        504: "The operation timed out. Please try again.",
-    }
 
-    message = generic_messages.get(status_code, "An error occurred.")
-    return HTTPException(status_code=status_code, detail=message)
+# Genie Space ID constraints, declared once so pydantic-core builds (and
+# caches) a single schema entry for all request models that carry one
+GenieSpaceId = Annotated[
+    str, Field(min_length=1, max_length=64, pattern=r"^[a-zA-Z0-9\-_]+$")
+]
 
 
 # Request/Response models
 class FetchSpaceRequest(BaseModel):
     """Request to fetch a Genie Space."""
 
-    genie_space_id: str = Field(
-        ..., min_length=1, max_length=64, pattern=r"^[a-zA-Z0-9\-_]+$"
-    )
+    genie_space_id: GenieSpaceId
 
 
 class FetchSpaceResponse(BaseModel):
@@ -92,17 +153,13 @@ class AnalyzeSectionRequest(BaseModel):
 class StreamAnalysisRequest(BaseModel):
     """Request for streaming analysis."""
 
-    genie_space_id: str = Field(
-        ..., min_length=1, max_length=64, pattern=r"^[a-zA-Z0-9\-_]+$"
-    )
+    genie_space_id: GenieSpaceId
 
 
 class GenieQueryRequest(BaseModel):
     """Request to query Genie for SQL."""
 
-    genie_space_id: str = Field(
-        ..., min_length=1, max_length=64, pattern=r"^[a-zA-Z0-9\-_]+$"
-    )
+    genie_space_id: GenieSpaceId
     question: str = Field(..., min_length=1, max_length=10000)
 
 
@@ -153,89 +210,124 @@ class AnalyzeAllSectionsResponse(BaseModel):
     is_full_analysis: bool
 
 
-@router.post("/space/fetch", response_model=FetchSpaceResponse)
+@router.post("/space/fetch")
 async def fetch_space(request: FetchSpaceRequest):
     """Fetch and parse a Genie Space by ID.
-    
-    Returns the space data and list of sections with their data.
+
+    Returns the space data and list of sections with their data
+    (shape: FetchSpaceResponse). The payload is server-built from
+    already-parsed JSON, so it is streamed out chunk-by-chunk through
+    orjson — one chunk for the envelope + space_data, then one per
+    section — instead of serializing the whole response into a single
+    buffer before the first byte leaves the server.
     """
     try:
         space_data = get_serialized_space(request.genie_space_id)
-        analyzer = get_analyzer()
-        all_sections = analyzer.get_all_sections(space_data)
-        
-        sections = [
-            {
-                "name": name,
-                "data": data,
-                "has_data": data is not None
-            }
-            for name, data in all_sections
-        ]
-        
-        return FetchSpaceResponse(
-            genie_space_id=request.genie_space_id,
-            space_data=space_data,
-            sections=sections,
-        )
     except Exception as e:
         raise _safe_error(e, 400, "Failed to fetch Genie space")
 
+    async def generate():
+        yield (
+            b'{"genie_space_id":' + orjson.dumps(request.genie_space_id)
+            + b',"space_data":' + orjson.dumps(space_data)
+            + b',"sections":['
+        )
+        # Section data is shared by reference with space_data; only the
+        # small wrapper dicts are allocated here
+        first = True
+        for name, data in _ANALYZER.get_all_sections(space_data):
+            section = {"name": name, "data": data, "has_data": data is not None}
+            yield (b"" if first else b",") + orjson.dumps(section)
+            first = False
+        yield b"]}"
+
+    return StreamingResponse(generate(), media_type="application/json")
+
+
+@router.post("/space/invalidate")
+async def invalidate_space(request: FetchSpaceRequest):
+    """Evict a Genie Space from the server-side fetch cache.
+
+    Spaces are cached briefly to avoid refetching within one analysis flow;
+    call this after editing a space in Genie to force a fresh fetch.
+    """
+    invalidate_space_cache(request.genie_space_id)
+    return {"status": "ok"}
 
-@router.post("/space/parse", response_model=FetchSpaceResponse)
+
+@router.post("/analyze/invalidate")
+async def invalidate_analysis(request: FetchSpaceRequest):
+    """Evict cached analysis results for a space to force a fresh run.
+
+    Analyses of unchanged space content are cached briefly; this clears
+    them, e.g. after editing the checklist markdown.
+    """
+    invalidate_analysis_cache(request.genie_space_id)
+    return {"status": "ok"}
+
+
+@router.post("/space/parse")
 async def parse_space_json(request: ParseJsonRequest):
     """Parse pasted Genie Space JSON.
 
     Accepts the raw API response from GET /api/2.0/genie/spaces/{id}?include_serialized_space=true
     Requires valid JSON format.
     """
-    from datetime import datetime
-
     try:
         try:
-            raw_response = json.loads(request.json_content)
-        except json.JSONDecodeError as e:
+            # orjson parses the up-to-1 MB blob in C; JSONDecodeError is a
+            # ValueError subclass so the error contract is unchanged
+            raw_response = orjson.loads(request.json_content)
+        except orjson.JSONDecodeError as e:
             raise HTTPException(
                 status_code=400,
                 detail=(
-                    f"Invalid JSON at line {e.lineno}, column {e.colno}: {e.msg}. "
+                    f"Invalid JSON: {e}. "
                     "Please ensure you are pasting valid JSON from the Databricks API response."
                 ),
             )
-        
+
         # Extract and parse the serialized_space field
         if "serialized_space" not in raw_response:
             raise HTTPException(
                 status_code=400,
                 detail="Invalid input: missing 'serialized_space' field"
             )
-        
+
         serialized = raw_response["serialized_space"]
         if isinstance(serialized, str):
-            space_data = json.loads(serialized)
+            space_data = orjson.loads(serialized)
         else:
             space_data = serialized
-        
+
+        # The wrapper dict and the escaped serialized string are as large
+        # as the space itself; drop them before building the response so
+        # peak memory holds one parsed copy, not the copy plus both
+        # intermediates
+        del raw_response, serialized
+
+
         # Generate placeholder ID
         genie_space_id = f"pasted-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
         
-        analyzer = get_analyzer()
-        all_sections = analyzer.get_all_sections(space_data)
-        
+        analyzer = _ANALYZER
+
         sections = [
             {
                 "name": name,
                 "data": data,
                 "has_data": data is not None
             }
-            for name, data in all_sections
+            for name, data in analyzer.get_all_sections(space_data)
         ]
         
-        return FetchSpaceResponse(
-            genie_space_id=genie_space_id,
-            space_data=space_data,
-            sections=sections
-        )
+        # Same FetchSpaceResponse shape as /space/fetch, returned directly
+        # through orjson — the payload was just parsed/built server-side
+        return ORJSONResponse({
+            "genie_space_id": genie_space_id,
+            "space_data": space_data,
+            "sections": sections,
+        })
     except HTTPException:
         raise
     except Exception as e:
@@ -246,7 +338,7 @@ async def parse_space_json(request: ParseJsonRequest):
 async def analyze_section(request: AnalyzeSectionRequest) -> SectionAnalysis:
     """Analyze a single section of the Genie Space."""
     try:
-        analyzer = get_analyzer()
+        analyzer = _ANALYZER
         analysis = analyzer.analyze_section(
             request.section_name,
             request.section_data,
@@ -277,17 +369,21 @@ async def synthesize_endpoint(request: SynthesizeRequest):
     and produces synthesis if so.
     """
     try:
-        analyzer = get_analyzer()
-        all_sections = analyzer.get_all_sections(request.full_space)
-        configured_names = {name for name, data in all_sections if data is not None}
+        analyzer = _ANALYZER
         analyzed_names = {a.section_name for a in request.analyses}
-        is_full_analysis = configured_names <= analyzed_names
+        # Single pass over the configured sections, short-circuiting on the
+        # first one that wasn't analyzed
+        is_full_analysis = all(
+            name in analyzed_names
+            for name, data in analyzer.get_all_sections(request.full_space)
+            if data is not None
+        )
 
         synthesis = None
         if is_full_analysis:
             synthesis = synthesize_analysis(request.analyses, is_full_analysis)
 
-        return SynthesizeResponse(
+        return SynthesizeResponse.model_construct(
             synthesis=synthesis,
             is_full_analysis=is_full_analysis,
         )
@@ -304,16 +400,12 @@ async def analyze_all_sections(request: AnalyzeAllSectionsRequest):
     completion, keeping data flowing through Databricks Apps reverse proxy.
 
     SSE events:
-    - {"status": "analyzing", "current": N, "total": M, "section": "name"}
+    - {"status": "analyzing", "current": N, "total": M, "section": "name",
+       "analysis": {...SectionAnalysis...}}
     - {"status": "synthesizing"}
     - {"status": "complete", "data": {...AnalyzeAllSectionsResponse...}}
     - {"status": "error", "message": "..."}
     """
-    import asyncio
-    import concurrent.futures
-
-    from agent_server.auth import get_obo_token, set_obo_token
-
     # Capture OBO token before entering the async generator
     captured_token = get_obo_token()
     sections_to_analyze = request.sections
@@ -323,80 +415,115 @@ async def analyze_all_sections(request: AnalyzeAllSectionsRequest):
     async def generate():
         """Async SSE generator — yields after each section to keep connection alive."""
         loop = asyncio.get_running_loop()
-        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
 
         try:
-            # Initialize analyzer in the worker thread (sets OBO token)
+            # Initialize analyzer in a worker thread (sets OBO token)
             def init():
                 set_obo_token(captured_token)
-                a = get_analyzer()
-                a.start_session()
-                return a
+                try:
+                    a = _ANALYZER
+                    a.start_session()
+                    return a
+                finally:
+                    set_obo_token(None)
 
-            analyzer = await loop.run_in_executor(executor, init)
+            analyzer = await loop.run_in_executor(_ANALYZE_EXECUTOR, init)
 
-            analyses = []
             total = len(sections_to_analyze)
 
-            # Analyze each section, yielding progress after each one
-            for i, section in enumerate(sections_to_analyze):
-                logger.info(f"[analyze-all] Analyzing section {i+1}/{total}: {section['name']}")
-
-                def do_analyze(s=section):
-                    set_obo_token(captured_token)
+            # Fan all sections out at once and yield a progress event as
+            # each completes — wall time becomes the slowest section, not
+            # the sum. Pool threads are recycled, so the OBO token is
+            # re-set per task.
+            def do_analyze(s):
+                set_obo_token(captured_token)
+                try:
                     return analyzer.analyze_section(
                         s["name"], s.get("data"), full_space=full_space,
                     )
+                finally:
+                    set_obo_token(None)
+
+            futures = [
+                loop.run_in_executor(_ANALYZE_EXECUTOR, do_analyze, s)
+                for s in sections_to_analyze
+            ]
+            analyses_by_name = {}
+            for future in asyncio.as_completed(futures):
+                analysis = await future
+                analyses_by_name[analysis.section_name] = analysis
+
+                event = {
+                    "status": "analyzing",
+                    "current": len(analyses_by_name),
+                    "total": total,
+                    "section": analysis.section_name,
+                    # Full section payload so the client can render each
+                    # analysis as it lands instead of waiting for the
+                    # slowest section before the complete frame arrives
+                    "analysis": analysis.model_dump(),
+                }
+                logger.info(
+                    f"[analyze-all] Section {len(analyses_by_name)}/{total} done "
+                    f"({analysis.section_name}), yielding progress"
+                )
+                yield b"data: " + orjson.dumps(event) + b"\n\n"
 
-                analysis = await loop.run_in_executor(executor, do_analyze)
-                analyses.append(analysis)
-
-                event = {"status": "analyzing", "current": i + 1, "total": total, "section": section["name"]}
-                logger.info(f"[analyze-all] Section {i+1}/{total} done, yielding progress")
-                yield f"data: {json.dumps(event)}\n\n"
+            # Preserve the request's section order in the final payload
+            analyses = [
+                analyses_by_name[s["name"]] for s in sections_to_analyze
+            ]
 
-            # Determine if full analysis
-            all_sections_list = analyzer.get_all_sections(full_space)
-            configured_section_names = {name for name, data in all_sections_list if data is not None}
+            # Determine if full analysis: every configured section must be
+            # among the analyzed ones (single pass, short-circuits)
             analyzed_section_names = {s["name"] for s in sections_to_analyze}
-            is_full_analysis = configured_section_names <= analyzed_section_names
+            is_full_analysis = all(
+                name in analyzed_section_names
+                for name, data in analyzer.get_all_sections(full_space)
+                if data is not None
+            )
 
             # Synthesis (if full analysis)
             synthesis = None
             if is_full_analysis:
-                yield f"data: {json.dumps({'status': 'synthesizing'})}\n\n"
+                yield b'data: {"status": "synthesizing"}\n\n'
                 logger.info("[analyze-all] Running synthesis")
 
                 def do_synthesize():
                     set_obo_token(captured_token)
-                    return synthesize_analysis(analyses, is_full_analysis)
+                    try:
+                        return synthesize_analysis(analyses, is_full_analysis)
+                    finally:
+                        set_obo_token(None)
 
-                synthesis = await loop.run_in_executor(executor, do_synthesize)
+                synthesis = await loop.run_in_executor(_ANALYZE_EXECUTOR, do_synthesize)
 
             result = AnalyzeAllSectionsResponse(
                 analyses=analyses, synthesis=synthesis, is_full_analysis=is_full_analysis,
             )
-            payload = json.dumps({"status": "complete", "data": result.model_dump()})
+            # model_dump_json serializes in pydantic-core; splice the
+            # pre-serialized JSON into the envelope instead of walking
+            # the model into a dict and re-serializing it
+            payload = result.model_dump_json().encode()
             logger.info(f"[analyze-all] Yielding complete event ({len(payload)} bytes)")
-            yield f"data: {payload}\n\n"
+            yield b'data: {"status": "complete", "data": ' + payload + b"}\n\n"
 
         except Exception as e:
             logger.exception(f"[analyze-all] Analysis failed: {e}")
-            yield f"data: {json.dumps({'status': 'error', 'message': str(e)})}\n\n"
+            yield b"data: " + orjson.dumps({"status": "error", "message": str(e)}) + b"\n\n"
         finally:
             # Clean up: end session in the worker thread
             try:
                 def cleanup():
                     set_obo_token(captured_token)
                     try:
-                        get_analyzer().end_session()
+                        _ANALYZER.end_session()
                     finally:
                         set_obo_token(None)
 
-                await loop.run_in_executor(executor, cleanup)
+                await loop.run_in_executor(_ANALYZE_EXECUTOR, cleanup)
             except Exception:
                 pass
-            executor.shutdown(wait=False)
 
     # Headers to prevent proxy buffering
     headers = {
@@ -412,32 +539,43 @@ async def stream_analysis(request: StreamAnalysisRequest):
 
     Returns Server-Sent Events with progress updates and final results.
     """
-    from agent_server.auth import get_obo_token, set_obo_token
-
-    # Capture OBO token before entering the sync generator thread
+    # Capture OBO token before stepping the generator in executor threads
     captured_token = get_obo_token()
 
-    def generate():
-        set_obo_token(captured_token)
-        try:
-            analyzer = get_analyzer()
-            input_obj = AgentInput(genie_space_id=request.genie_space_id)
-            gen = analyzer.predict_streaming(input_obj)
+    async def generate():
+        """Async SSE generator — only the blocking iterator steps leave the
+        event loop, so per-yield overhead stays on the fast async path."""
+        loop = asyncio.get_running_loop()
+        analyzer = _ANALYZER
+        input_obj = AgentInput(genie_space_id=request.genie_space_id)
+        gen = analyzer.predict_streaming(input_obj)
 
-            result = None
+        def step():
+            # Default-executor threads are recycled and don't inherit this
+            # request's context; re-set the OBO token per step
+            set_obo_token(captured_token)
             try:
-                while True:
-                    progress = next(gen)
-                    yield f"data: {json.dumps(progress)}\n\n"
+                return False, next(gen)
             except StopIteration as e:
-                result = e.value
+                return True, e.value
+            finally:
+                set_obo_token(None)
 
-            if result:
-                from agent_server.agent import save_analysis_output
-                save_analysis_output(result)
-                yield f"data: {json.dumps({'status': 'result', 'data': result.model_dump()})}\n\n"
-        finally:
-            set_obo_token(None)
+        while True:
+            done, item = await loop.run_in_executor(None, step)
+            if done:
+                break
+            # orjson returns bytes, which StreamingResponse passes
+            # through without an encode step
+            yield b"data: " + orjson.dumps(item) + b"\n\n"
+
+        if item:
+            await asyncio.to_thread(save_analysis_output, item)
+            # model_dump_json serializes in pydantic-core; splice the
+            # pre-serialized JSON into the envelope instead of walking
+            # the model into a dict and re-serializing it
+            payload = item.model_dump_json().encode()
+            yield b'data: {"status": "result", "data": ' + payload + b"}\n\n"
 
     return StreamingResponse(generate(), media_type="text/event-stream")
 
@@ -450,35 +588,59 @@ async def query_genie(request: GenieQueryRequest):
     Returns the generated SQL if successful.
     """
     try:
-        from agent_server.ingest import query_genie_for_sql
-
         result = query_genie_for_sql(
             genie_space_id=request.genie_space_id,
             question=request.question,
         )
 
-        return GenieQueryResponse(**result)
+        return GenieQueryResponse.model_construct(**result)
     except TimeoutError as e:
         raise _safe_error(e, 504, "Genie query timed out")
     except Exception as e:
         raise _safe_error(e, 500, "Genie query failed")
 
 
+# Checklist markdown cached with its mtime: the file is user-editable at
+# runtime (it's the single source of truth for checks), so a plain
+# read-once cache would hide edits. The cache holds the fully serialized
+# response body, so a warm hit is one stat plus a constant-time Response.
+_CHECKLIST_MD_PATH = Path(__file__).parent.parent / "docs" / "checklist-by-schema.md"
+_checklist_body_cache: tuple[float, bytes] | None = None
+
+
 @router.get("/checklist")
 async def get_checklist():
     """Get the checklist markdown documentation."""
-    docs_path = Path(__file__).parent.parent / "docs" / "checklist-by-schema.md"
+    global _checklist_body_cache
     try:
-        content = docs_path.read_text()
-        return {"content": content}
+        mtime = _CHECKLIST_MD_PATH.stat().st_mtime
+        if _checklist_body_cache is None or _checklist_body_cache[0] != mtime:
+            _checklist_body_cache = (
+                mtime,
+                orjson.dumps({"content": _CHECKLIST_MD_PATH.read_text()}),
+            )
+        return Response(
+            content=_checklist_body_cache[1], media_type="application/json"
+        )
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Checklist documentation not found")
 
 
+# SECTIONS is fixed at import, so the /sections body is too
+_SECTIONS_RESPONSE = orjson.dumps({"sections": SECTIONS})
+
+
 @router.get("/sections")
 async def get_sections():
     """Get the list of all section names."""
-    return {"sections": SECTIONS}
+    return Response(content=_SECTIONS_RESPONSE, media_type="application/json")
+
+
+# current_user.me() result for /debug/auth, refreshed every 60s. The
+# endpoint is local-dev only (no OBO token to vary on) but gets polled as
+# a liveness check, and each me() call is a workspace API round-trip.
+_DEBUG_USER_TTL = 60.0
+_debug_user_cache: tuple[float, dict] | None = None
 
 
 @router.get("/debug/auth")
@@ -488,9 +650,7 @@ async def debug_auth():
     Returns information about the current authentication context.
     Only available in development mode (not on Databricks Apps).
     """
-    import os
-
-    from agent_server.auth import get_workspace_client, is_running_on_databricks_apps
+    global _debug_user_cache
 
     # Disable in production to avoid exposing auth info
     if is_running_on_databricks_apps():
@@ -498,17 +658,22 @@ async def debug_auth():
 
     try:
         client = get_workspace_client()
-        
+
         # Try to get current user/service principal to verify auth is working
-        try:
-            current_user = client.current_user.me()
-            user_info = {
-                "user_name": current_user.user_name,
-                "display_name": current_user.display_name,
-            }
-        except Exception as e:
-            user_info = {"error": str(e)}
-        
+        now = time.monotonic()
+        if _debug_user_cache is not None and now - _debug_user_cache[0] < _DEBUG_USER_TTL:
+            user_info = _debug_user_cache[1]
+        else:
+            try:
+                current_user = client.current_user.me()
+                user_info = {
+                    "user_name": current_user.user_name,
+                    "display_name": current_user.display_name,
+                }
+                _debug_user_cache = (now, user_info)
+            except Exception as e:
+                user_info = {"error": str(e)}
+
         return {
             "running_on_databricks_apps": is_running_on_databricks_apps(),
             "host": client.config.host,
@@ -535,35 +700,38 @@ async def execute_sql_endpoint(request: ExecuteSqlRequest):
     Limited to 1000 rows to prevent memory issues.
     Only read-only SELECT queries are allowed.
     """
-    from agent_server.sql_executor import execute_sql
-
     try:
         result = execute_sql(
             sql=request.sql,
             warehouse_id=request.warehouse_id,
         )
-        return ExecuteSqlResponse(**result)
+        return ExecuteSqlResponse.model_construct(**result)
     except Exception as e:
         raise _safe_error(e, 500, "SQL execution failed")
 
 
+# Settings are static for the life of the process (env vars plus the
+# workspace host, which get_databricks_host resolves via a WorkspaceClient),
+# so the response is built once on first request
+_settings_cache: SettingsResponse | None = None
+
+
 @router.get("/settings", response_model=SettingsResponse)
 async def get_settings():
     """Get application settings for the Settings page.
 
     Returns read-only configuration values.
     """
-    import os
-    from agent_server.auth import get_databricks_host
-    from agent_server.sql_executor import get_sql_warehouse_id
-
-    return SettingsResponse(
-        genie_space_id=None,  # This is session-specific, passed from frontend
-        llm_model=os.environ.get("LLM_MODEL", "databricks-claude-sonnet-4"),
-        sql_warehouse_id=get_sql_warehouse_id(),
-        databricks_host=get_databricks_host(),
-        workspace_directory=os.environ.get("GENIE_TARGET_DIRECTORY", "").strip() or None,
-    )
+    global _settings_cache
+    if _settings_cache is None:
+        _settings_cache = SettingsResponse.model_construct(
+            genie_space_id=None,  # This is session-specific, passed from frontend
+            llm_model=os.environ.get("LLM_MODEL", "databricks-claude-sonnet-4"),
+            sql_warehouse_id=get_sql_warehouse_id(),
+            databricks_host=get_databricks_host(),
+            workspace_directory=os.environ.get("GENIE_TARGET_DIRECTORY", "").strip() or None,
+        )
+    return _settings_cache
 
 
 @router.post("/auto-label", response_model=AutoLabelResponse)
@@ -572,15 +740,13 @@ async def auto_label(request: AutoLabelRequest):
 
     Uses programmatic comparison first, falling back to LLM for ambiguous cases.
     """
-    from agent_server.error_analysis import auto_label_items
-
     logger.info(f"Auto-labeling {len(request.items)} items")
 
     try:
         items = [item.model_dump() for item in request.items]
         results = auto_label_items(items)
-        return AutoLabelResponse(
-            results=[AutoLabelResult(**r) for r in results]
+        return AutoLabelResponse.model_construct(
+            results=[AutoLabelResult.model_construct(**r) for r in results]
         )
     except Exception as e:
         raise _safe_error(e, 500, "Auto-labeling failed")
@@ -595,11 +761,6 @@ async def stream_optimizations(request: OptimizationRequest):
     - {"status": "complete", "data": {...}} - final result
     - {"status": "error", "message": "..."} - if optimization fails
     """
-    import asyncio
-    import concurrent.futures
-
-    from agent_server.auth import get_obo_token, set_obo_token
-
     logger.info(f"Received streaming optimization request for space: {request.genie_space_id}")
     logger.info(f"Feedback items count: {len(request.labeling_feedback)}")
 
@@ -609,21 +770,23 @@ async def stream_optimizations(request: OptimizationRequest):
     async def generate():
         """Async SSE generator with heartbeats."""
         loop = asyncio.get_event_loop()
-        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
 
         # Run optimizer in thread pool with OBO token propagation
         def run_optimizer():
             set_obo_token(captured_token)
             try:
-                optimizer = get_optimizer()
-                return optimizer.generate_optimizations(
+                optimizer = _OPTIMIZER
+                result = optimizer.generate_optimizations(
                     space_data=request.space_data,
                     labeling_feedback=request.labeling_feedback,
                 )
+                # Dump to plain JSON types here in the worker so the big
+                # payload walk doesn't run on the event loop
+                return result.model_dump(mode="json")
             finally:
                 set_obo_token(None)
 
-        future = loop.run_in_executor(executor, run_optimizer)
+        future = loop.run_in_executor(_OPT_EXECUTOR, run_optimizer)
         start_time = loop.time()
         heartbeat_interval = 15  # seconds
 
@@ -632,11 +795,11 @@ async def stream_optimizations(request: OptimizationRequest):
             if future.done():
                 try:
                     result = future.result()
-                    logger.info(f"Generated {len(result.suggestions)} suggestions, sending complete event")
-                    yield f"data: {json.dumps({'status': 'complete', 'data': result.model_dump()})}\n\n"
+                    logger.info(f"Generated {len(result['suggestions'])} suggestions, sending complete event")
+                    yield b"data: " + orjson.dumps({"status": "complete", "data": result}) + b"\n\n"
                 except Exception as e:
                     logger.exception(f"Optimization failed: {e}")
-                    yield f"data: {json.dumps({'status': 'error', 'message': str(e)})}\n\n"
+                    yield b"data: " + orjson.dumps({"status": "error", "message": str(e)}) + b"\n\n"
                 break
 
             # Wait for result or send heartbeat on timeout
@@ -644,16 +807,20 @@ async def stream_optimizations(request: OptimizationRequest):
                 result = await asyncio.wait_for(
                     asyncio.shield(future), timeout=heartbeat_interval
                 )
-                logger.info(f"Generated {len(result.suggestions)} suggestions, sending complete event")
-                yield f"data: {json.dumps({'status': 'complete', 'data': result.model_dump()})}\n\n"
+                logger.info(f"Generated {len(result['suggestions'])} suggestions, sending complete event")
+                yield b"data: " + orjson.dumps({"status": "complete", "data": result}) + b"\n\n"
                 break
             except asyncio.TimeoutError:
                 elapsed = int(loop.time() - start_time)
                 logger.info(f"Sending heartbeat at {elapsed}s")
-                yield f"data: {json.dumps({'status': 'processing', 'message': f'Generating suggestions... ({elapsed}s elapsed)', 'elapsed_seconds': elapsed})}\n\n"
+                yield b"data: " + orjson.dumps({
+                    "status": "processing",
+                    "message": f"Generating suggestions... ({elapsed}s elapsed)",
+                    "elapsed_seconds": elapsed,
+                }) + b"\n\n"
             except Exception as e:
                 logger.exception(f"Optimization failed: {e}")
-                yield f"data: {json.dumps({'status': 'error', 'message': str(e)})}\n\n"
+                yield b"data: " + orjson.dumps({"status": "error", "message": str(e)}) + b"\n\n"
                 break
 
     # Headers to prevent proxy buffering
@@ -673,7 +840,7 @@ async def merge_config(request: ConfigMergeRequest):
     logger.info(f"Received config merge request with {len(request.suggestions)} suggestions")
 
     try:
-        optimizer = get_optimizer()
+        optimizer = _OPTIMIZER
         result = optimizer.merge_config(
             space_data=request.space_data,
             suggestions=request.suggestions,
@@ -690,18 +857,16 @@ async def create_genie_space(request: GenieCreateRequest):
     Creates a new Genie Space in the target directory using the optimized
     configuration. Requires GENIE_TARGET_DIRECTORY to be configured.
     """
-    from agent_server.genie_creator import create_genie_space as do_create
-
     logger.info(f"Creating new Genie Space: {request.display_name}")
 
     try:
-        result = do_create(
+        result = do_create_genie_space(
             display_name=request.display_name,
             merged_config=request.merged_config,
             parent_path=request.parent_path,
             sql_warehouse_id=request.sql_warehouse_id,
         )
-        return GenieCreateResponse(**result)
+        return GenieCreateResponse.model_construct(**result)
     except ValueError as e:
         # Invalid config or missing env var
         raise HTTPException(status_code=400, detail=str(e))
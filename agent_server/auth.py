@@ -8,11 +8,35 @@ and falls back to PAT token or CLI authentication for local development.
 import contextvars
 import logging
 import os
+import threading
+import time
 
 from databricks.sdk import WorkspaceClient
+from dotenv import load_dotenv
+
+load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Environment is fixed for the life of the process (dotenv above runs before
+# these bind), so the hot lookups are resolved once instead of going through
+# the os.environ wrapper on every call
+_ON_DATABRICKS_APPS = os.environ.get("DATABRICKS_APP_PORT") is not None
+_ENV_HOST = (os.environ.get("DATABRICKS_HOST") or "").rstrip("/")
+_ENV_TOKEN = os.environ.get("DATABRICKS_TOKEN", "")
+
+# WorkspaceClient cache keyed by OBO token (None for local dev). One request
+# constructs a client several times (host lookup, LLM auth headers, space
+# fetch), and each construction re-runs the SDK's auth detection. Keying on
+# the token keeps one user's client from ever serving another; the TTL keeps
+# entries from outliving token rotation. Keyed rather than ContextVar-scoped
+# because the analysis fan-out runs in pool threads that don't share the
+# request context.
+_CLIENT_CACHE_TTL = float(os.environ.get("WORKSPACE_CLIENT_CACHE_TTL_SECONDS", "300"))
+_CLIENT_CACHE_MAX = 64
+_client_cache: dict[str | None, tuple[float, WorkspaceClient]] = {}
+_client_cache_lock = threading.Lock()
+
 # Per-request OBO token set by middleware
 _obo_token: contextvars.ContextVar[str | None] = contextvars.ContextVar(
     "_obo_token", default=None
@@ -31,7 +55,7 @@ def get_obo_token() -> str | None:
 
 def is_running_on_databricks_apps() -> bool:
     """Check if running on Databricks Apps (vs local development)."""
-    return os.environ.get("DATABRICKS_APP_PORT") is not None
+    return _ON_DATABRICKS_APPS
 
 
 def get_workspace_client() -> WorkspaceClient:
@@ -48,14 +72,32 @@ def get_workspace_client() -> WorkspaceClient:
         WorkspaceClient configured for the current environment
     """
     token = get_obo_token()
+    now = time.monotonic()
+
+    with _client_cache_lock:
+        entry = _client_cache.get(token)
+        if entry is not None and now - entry[0] < _CLIENT_CACHE_TTL:
+            return entry[1]
 
     if token:
         host = get_databricks_host()
         logger.debug("Creating OBO WorkspaceClient for host: %s", host)
-        return WorkspaceClient(host=host, token=token, auth_type="pat")
+        client = WorkspaceClient(host=host, token=token, auth_type="pat")
+    else:
+        # Local dev fallback — let SDK auto-detect auth
+        client = WorkspaceClient()
 
-    # Local dev fallback — let SDK auto-detect auth
-    return WorkspaceClient()
+    with _client_cache_lock:
+        if len(_client_cache) >= _CLIENT_CACHE_MAX:
+            # Drop the stalest entry rather than tracking full LRU order
+            del _client_cache[min(_client_cache, key=lambda k: _client_cache[k][0])]
+        _client_cache[token] = (now, client)
+    return client
+
+
+# Host resolved through the SDK when DATABRICKS_HOST is unset; fixed for
+# the process lifetime, so resolve (and pay client construction) once
+_sdk_resolved_host: str | None = None
 
 
 def get_databricks_host() -> str:
@@ -64,14 +106,17 @@ def get_databricks_host() -> str:
     Returns:
         The Databricks host URL (without trailing slash)
     """
+    global _sdk_resolved_host
+
     # On Apps, DATABRICKS_HOST is always set by the platform
-    host = os.environ.get("DATABRICKS_HOST", "")
-    if host:
-        return host.rstrip("/")
+    if _ENV_HOST:
+        return _ENV_HOST
 
-    # Local dev fallback — let SDK resolve it
-    client = WorkspaceClient()
-    return (client.config.host or "").rstrip("/")
+    # Local dev fallback — let SDK resolve it (profile/config file)
+    if _sdk_resolved_host is None:
+        client = WorkspaceClient()
+        _sdk_resolved_host = (client.config.host or "").rstrip("/")
+    return _sdk_resolved_host
 
 
 def get_llm_api_key() -> str:
@@ -90,4 +135,4 @@ def get_llm_api_key() -> str:
     if token:
         return token
 
-    return os.environ.get("DATABRICKS_TOKEN", "")
+    return _ENV_TOKEN
@@ -4,9 +4,13 @@ This module provides the single source of truth for all checklist items
 by parsing them from the markdown documentation file.
 """
 
+import hashlib
 import re
 from pathlib import Path
 from functools import lru_cache
+from types import MappingProxyType
+
+import orjson
 
 
 # Sections to analyze (in order for UI walkthrough)
@@ -27,9 +31,56 @@ SECTIONS = [
 # Set version for fast lookup (derived from SECTIONS)
 RECOGNIZED_SECTIONS = set(SECTIONS)
 
+# Dot-paths pre-split into tuples so section extraction doesn't re-split
+# the same strings on every space (derived from SECTIONS)
+SECTION_PATHS = {section: tuple(section.split(".")) for section in SECTIONS}
+
 # Default path to checklist markdown file
 DEFAULT_CHECKLIST_PATH = Path(__file__).parent.parent / "docs" / "checklist-by-schema.md"
 
+# Optional build-time sidecar (see scripts/build_checklist.py); loaded
+# instead of parsing the markdown when its recorded source hash matches
+# the markdown's current content
+DEFAULT_CHECKLIST_JSON_PATH = DEFAULT_CHECKLIST_PATH.with_suffix(".json")
+
+
+def checklist_source_hash(markdown_path: Path | None = None) -> str:
+    """Content hash of the checklist markdown, recorded in the sidecar."""
+    path = markdown_path or DEFAULT_CHECKLIST_PATH
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+
+# Patterns compiled once at import; calling the bound sub/search methods
+# skips re's per-call cache lookup on every line
+_RE_BACKTICKED = re.compile(r"`([^`]+)`")
+_RE_PL_TAG = re.compile(r"\*\*\[(P|L)\]\*\*\s*")
+
+# Translation table for slugify: drop quotes/backticks, map every other
+# char that isn't a-z or 0-9 (including hyphens) to a space; the
+# split/join below then collapses runs and trims the ends in one pass
+class _SlugTable(dict):
+    """Translate table mapping any codepoint outside [a-z0-9] to a space.
+
+    str.translate consults the table per character, so ``__missing__``
+    covers codepoints that can't be enumerated up front (em dashes,
+    curly quotes, accented letters, ...) and caches them, matching the
+    old ``[^a-z0-9\\s-]`` regex that spaced out all non-ASCII text.
+    """
+
+    def __missing__(self, codepoint: int) -> str:
+        self[codepoint] = " "
+        return " "
+
+
+_SLUG_TABLE = _SlugTable({ord(c): None for c in "`'\""})
+for _cp in range(128):
+    _ch = chr(_cp)
+    if "a" <= _ch <= "z" or "0" <= _ch <= "9":
+        _SLUG_TABLE[_cp] = _cp  # identity, so keeps never hit __missing__
+    elif _ch not in "`'\"":
+        _SLUG_TABLE[_cp] = " "
+del _cp, _ch
+
 
 def slugify(text: str) -> str:
     """Convert description text to a stable ID slug.
@@ -38,13 +89,9 @@ def slugify(text: str) -> str:
         "At least 1 table is configured" -> "at-least-1-table-is-configured"
         "Tables are focused (only necessary tables)" -> "tables-are-focused-only-necessary-tables"
     """
-    # Remove backticks and special chars, lowercase, replace spaces with hyphens
-    slug = text.lower()
-    slug = re.sub(r"[`'\"]", "", slug)  # Remove quotes/backticks
-    slug = re.sub(r"[^a-z0-9\s-]", " ", slug)  # Replace special chars with space
-    slug = re.sub(r"\s+", "-", slug.strip())  # Replace spaces with hyphens
-    slug = re.sub(r"-+", "-", slug)  # Collapse multiple hyphens
-    return slug
+    # One translate pass (drop quotes, non-alnum -> space) plus split/join,
+    # which collapses runs and trims ends — no regex engine involved
+    return "-".join(text.lower().translate(_SLUG_TABLE).split())
 
 
 def parse_checklist_markdown(markdown_path: Path | None = None) -> dict[str, list[dict]]:
@@ -69,89 +116,119 @@ def parse_checklist_markdown(markdown_path: Path | None = None) -> dict[str, lis
     if markdown_path is None:
         markdown_path = DEFAULT_CHECKLIST_PATH
 
-    content = markdown_path.read_text()
-    lines = content.split("\n")
-
-    result: dict[str, list[dict]] = {section: [] for section in RECOGNIZED_SECTIONS}
+    # Seed from the ordered SECTIONS list (not the set) so the output —
+    # and the sidecar built from it — has a deterministic key order
+    result: dict[str, list[dict]] = {section: [] for section in SECTIONS}
 
     # Track current section hierarchy
     current_h2 = ""  # e.g., "data_sources", "instructions", "benchmarks"
     current_h3 = ""  # e.g., "tables", "metric_views", "sql_snippets"
     current_h4 = ""  # e.g., "filters", "expressions", "measures"
 
-    for line in lines:
-        stripped = line.strip()
-
-        # Parse headers to track section hierarchy
-        if stripped.startswith("## "):
-            # Extract section name from backticks: ## `data_sources` -> data_sources
-            match = re.search(r"`([^`]+)`", stripped)
-            current_h2 = match.group(1) if match else ""
-            current_h3 = ""
-            current_h4 = ""
-
-        elif stripped.startswith("### "):
-            match = re.search(r"`([^`]+)`", stripped)
-            current_h3 = match.group(1) if match else ""
-            current_h4 = ""
-
-        elif stripped.startswith("#### "):
-            match = re.search(r"`([^`]+)`", stripped)
-            current_h4 = match.group(1) if match else ""
-
-        # Parse checklist items: - [ ] **[P]** Description or - [ ] **[L]** Description
-        # Also support items without [P]/[L] tags: - [ ] Description
-        elif stripped.startswith("- [ ]"):
-            # Remove the checkbox prefix and any [P]/[L] tags
-            item_text = stripped[5:].strip()  # Remove "- [ ]"
-            item_text = re.sub(r"\*\*\[(P|L)\]\*\*\s*", "", item_text)  # Remove **[P]** or **[L]**
-            item_text = item_text.strip()
-
-            if not item_text:
-                continue
-
-            # Build section path
-            if current_h4:
-                section_path = f"{current_h2}.{current_h3}.{current_h4}"
-            elif current_h3:
-                section_path = f"{current_h2}.{current_h3}"
-            else:
-                continue  # Skip items not under a recognized section
-
-            # Only add if it's a recognized section
-            if section_path in RECOGNIZED_SECTIONS:
-                result[section_path].append({
-                    "id": slugify(item_text),
-                    "description": item_text,
-                })
+    # Iterate the file directly instead of materializing the whole text
+    # plus a list of every line
+    with markdown_path.open(encoding="utf-8") as f:
+        for line in f:
+            stripped = line.strip()
+
+            # Dispatch on the first character so the common case (blank
+            # lines, prose, nested bullets) fails a single comparison
+            # instead of four startswith checks
+            first = stripped[:1]
+
+            # Parse headers to track section hierarchy, e.g.
+            # ## `data_sources` -> data_sources at depth 2
+            if first == "#":
+                depth = len(stripped) - len(stripped.lstrip("#"))
+                if stripped[depth : depth + 1] != " ":
+                    continue
+                match = _RE_BACKTICKED.search(stripped)
+                name = match.group(1) if match else ""
+                if depth == 2:
+                    current_h2, current_h3, current_h4 = name, "", ""
+                elif depth == 3:
+                    current_h3, current_h4 = name, ""
+                elif depth == 4:
+                    current_h4 = name
+
+            # Parse checklist items: - [ ] **[P]** Description or - [ ] **[L]** Description
+            # Also support items without [P]/[L] tags: - [ ] Description
+            elif first == "-" and stripped.startswith("- [ ]"):
+                # Remove the checkbox prefix and any [P]/[L] tags
+                item_text = stripped[5:].strip()  # Remove "- [ ]"
+                item_text = _RE_PL_TAG.sub("", item_text)  # Remove **[P]** or **[L]**
+                item_text = item_text.strip()
+
+                if not item_text:
+                    continue
+
+                # Build section path
+                if current_h4:
+                    section_path = f"{current_h2}.{current_h3}.{current_h4}"
+                elif current_h3:
+                    section_path = f"{current_h2}.{current_h3}"
+                else:
+                    continue  # Skip items not under a recognized section
+
+                # Only add if it's a recognized section
+                if section_path in RECOGNIZED_SECTIONS:
+                    result[section_path].append({
+                        "id": slugify(item_text),
+                        "description": item_text,
+                    })
 
     return result
 
 
 @lru_cache(maxsize=1)
-def get_checklist_items() -> dict[str, list[dict]]:
+def get_checklist_items() -> MappingProxyType:
     """Get all checklist items, cached for performance.
 
+    Loads the JSON sidecar generated by scripts/build_checklist.py when
+    it exists and its recorded source hash matches the markdown's current
+    content — one orjson parse instead of the regex walk. The hash (not
+    mtime, which git checkouts don't preserve) guarantees an edited
+    markdown always wins, preserving its role as the single source of
+    truth even when the committed sidecar is stale.
+
     Returns:
         Dict mapping section names to lists of checklist items.
     """
-    return parse_checklist_markdown()
+    try:
+        sidecar = orjson.loads(DEFAULT_CHECKLIST_JSON_PATH.read_bytes())
+        if sidecar.get("source_hash") == checklist_source_hash():
+            return _freeze(sidecar["items"])
+    except (FileNotFoundError, orjson.JSONDecodeError, KeyError, AttributeError):
+        pass
+    return _freeze(parse_checklist_markdown())
+
+
+def _freeze(items: dict[str, list[dict]]):
+    """Make the cached checklist structure read-only.
+
+    The result is shared by every caller for the life of the cache; a
+    read-only mapping of tuples means nobody can mutate it (corrupting
+    the cache for everyone else) and nobody needs a defensive copy.
+    """
+    return MappingProxyType({section: tuple(v) for section, v in items.items()})
 
 
-def get_checklist_items_for_section(section_name: str) -> list[dict]:
+@lru_cache(maxsize=None)
+def get_checklist_items_for_section(section_name: str) -> tuple[dict, ...]:
     """Get checklist items for a specific section.
 
     Args:
         section_name: Section name (e.g., "data_sources.tables")
 
     Returns:
-        List of checklist items with 'id' and 'description' keys.
-        Returns empty list if section is not recognized.
+        Tuple of checklist items with 'id' and 'description' keys.
+        Returns an empty tuple if section is not recognized.
     """
     items = get_checklist_items()
-    return items.get(section_name, [])
+    return items.get(section_name, ())
 
 
 def clear_cache() -> None:
     """Clear the cached checklist items. Useful for testing or hot-reloading."""
     get_checklist_items.cache_clear()
+    get_checklist_items_for_section.cache_clear()
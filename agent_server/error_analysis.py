@@ -4,9 +4,13 @@ Compares Genie's SQL execution results against expected results using
 programmatic analysis first, falling back to LLM for ambiguous cases.
 """
 
+import json
 import logging
+
 from pydantic import BaseModel
 
+from agent_server.prompts import get_error_analysis_prompt
+
 logger = logging.getLogger(__name__)
 
 
@@ -226,8 +230,6 @@ def llm_compare_results(
 
     Called as fallback when programmatic comparison returns "uncertain".
     """
-    import json
-    from agent_server.prompts import get_error_analysis_prompt
     from agent_server.agent import get_analyzer
 
     prompt = get_error_analysis_prompt(
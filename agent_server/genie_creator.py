@@ -4,6 +4,7 @@ Genie Space creation utilities.
 Creates new Genie Spaces from optimized configurations via the Databricks API.
 """
 
+import copy
 import json
 import logging
 import os
@@ -57,7 +58,6 @@ def _enforce_constraints(config: dict) -> dict:
     - Text instructions: At most 1 allowed (keep first only)
     - Empty SQL snippets: Remove filters/expressions/measures with empty sql
     """
-    import copy
     config = copy.deepcopy(config)
 
     # Limit text_instructions to 1
@@ -8,16 +8,37 @@ Supports both local development (PAT) and Databricks Apps (OBO) authentication.
 import json
 import logging
 import os
+import threading
 import time
 
 from dotenv import load_dotenv
 
-from agent_server.auth import get_workspace_client, is_running_on_databricks_apps
+from agent_server.auth import get_obo_token, get_workspace_client, is_running_on_databricks_apps
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Short-lived cache for serialized spaces: a single analysis flow fetches the
+# same space several times (/space/fetch, then predict/streaming), each a
+# workspace API round-trip. Entries are keyed per caller (OBO token) so one
+# user's fetch never satisfies another's, and expire quickly so edits made in
+# Genie show up on the next analysis.
+_SPACE_CACHE_TTL = float(os.environ.get("SPACE_CACHE_TTL_SECONDS", "300"))
+_SPACE_CACHE_MAX = 64
+_space_cache: dict[tuple[str, str | None], tuple[float, dict]] = {}
+_space_cache_lock = threading.Lock()
+
+
+def invalidate_space_cache(genie_space_id: str | None = None) -> None:
+    """Evict cached space entries (all of them if no ID is given)."""
+    with _space_cache_lock:
+        if genie_space_id is None:
+            _space_cache.clear()
+        else:
+            for key in [k for k in _space_cache if k[0] == genie_space_id]:
+                del _space_cache[key]
+
 
 def get_genie_space(
     genie_space_id: str | None = None,
@@ -72,8 +93,25 @@ def get_serialized_space(genie_space_id: str | None = None) -> dict:
     Returns:
         Parsed serialized space configuration as a dictionary
     """
+    genie_space_id = genie_space_id or os.environ.get("GENIE_SPACE_ID")
+    cache_key = (genie_space_id or "", get_obo_token())
+    now = time.monotonic()
+
+    with _space_cache_lock:
+        entry = _space_cache.get(cache_key)
+        if entry is not None and now - entry[0] < _SPACE_CACHE_TTL:
+            logger.info(f"Serving Genie Space {genie_space_id} from cache")
+            return entry[1]
+
     data = get_genie_space(genie_space_id=genie_space_id)
-    return json.loads(data["serialized_space"])
+    space = json.loads(data["serialized_space"])
+
+    with _space_cache_lock:
+        if len(_space_cache) >= _SPACE_CACHE_MAX:
+            # Drop the stalest entry rather than tracking full LRU order
+            del _space_cache[min(_space_cache, key=lambda k: _space_cache[k][0])]
+        _space_cache[cache_key] = (now, space)
+    return space
 
 
 def query_genie_for_sql(
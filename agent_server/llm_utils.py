@@ -1,46 +1,114 @@
 """Shared LLM utilities for calling serving endpoints and parsing responses."""
 
-import json
 import logging
 import os
+import re
 import time
 
+import httpx
+import orjson
+
 from agent_server.auth import get_workspace_client
 
 logger = logging.getLogger(__name__)
 
+# Process-wide HTTP client so concurrent section calls reuse keep-alive
+# connections instead of paying TCP+TLS setup per request. httpx.Client is
+# thread-safe, so the worker-thread fan-out shares it too. Auth headers are
+# passed per call (they vary with the OBO token).
+_http_client = httpx.Client(
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    timeout=httpx.Timeout(600.0, connect=10.0),
+)
+
+# Matches a response fully wrapped in a markdown code fence (```json ... ```),
+# compiled once instead of splitting/rescanning lines per response
+_CODE_FENCE_RE = re.compile(r"^```[a-zA-Z0-9]*\s*\n(.*?)\n?\s*```\s*$", re.DOTALL)
+
 
 def get_llm_model() -> str:
     """Get the configured LLM model name."""
     return os.environ.get("LLM_MODEL", "databricks-claude-sonnet-4")
 
 
+def _consume_sse_stream(resp) -> str:
+    """Accumulate content deltas from an OpenAI-style SSE chat stream.
+
+    Consuming tokens as they are generated (instead of waiting for the
+    full body) lets transfer overlap with generation and surfaces
+    failures earlier.
+    """
+    parts: list[str] = []
+    for line in resp.iter_lines():
+        if not line or not line.startswith("data:"):
+            continue
+        payload = line[5:].strip()
+        if payload == "[DONE]":
+            break
+        try:
+            chunk = orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            logger.debug(f"Skipping unparseable stream chunk: {payload[:100]}")
+            continue
+        choices = chunk.get("choices") or []
+        if choices:
+            delta = choices[0].get("delta") or {}
+            content = delta.get("content")
+            if content:
+                parts.append(content)
+    return "".join(parts)
+
+
+def _parse_completion_response(response: dict | object) -> str:
+    """Extract the assistant content from an OpenAI-compatible response."""
+    if not isinstance(response, dict):
+        raise ValueError(f"Unexpected response type: {type(response)}")
+
+    if "choices" not in response:
+        logger.error(f"Response missing 'choices': {response}")
+        raise ValueError(f"Response missing 'choices' key: {list(response.keys())}")
+
+    if not response["choices"]:
+        raise ValueError("Response has empty 'choices' list")
+
+    return response["choices"][0]["message"]["content"]
+
+
 def call_serving_endpoint(
     messages: list[dict],
     model: str | None = None,
     max_tokens: int | None = None,
     timeout: float = 600,
+    max_retries: int = 2,
+    stream: bool = False,
+    response_format: dict | None = None,
 ) -> str:
     """Call the LLM serving endpoint using httpx with explicit timeout.
 
     Uses httpx instead of the SDK's api_client.do() to avoid opaque retry
     behavior on 429 (rate limit) responses that can cause silent 5-minute hangs.
+    Instead, 429s are retried here with a short bounded backoff (honoring
+    Retry-After when present) so transient rate limits under concurrent
+    section analysis don't fail the whole request.
 
     Args:
         messages: List of chat messages in OpenAI format
         model: Model name to use. Defaults to LLM_MODEL env var.
         max_tokens: Optional max tokens for response.
         timeout: Per-request timeout in seconds (default 600s / 10 min).
+        max_retries: Number of retries on 429 responses (default 2).
+        stream: If True, request an SSE stream and accumulate token deltas
+            as they arrive instead of buffering the full response body.
+        response_format: Optional response_format body field, e.g.
+            {"type": "json_object"} to constrain output to raw JSON.
 
     Returns:
         The assistant's response content
 
     Raises:
-        RuntimeError: If rate limited (429) or other HTTP error
+        RuntimeError: If rate limited (429) after retries or other HTTP error
         ValueError: If response format is unexpected or content is empty
     """
-    import httpx
-
     if model is None:
         model = get_llm_model()
 
@@ -55,50 +123,70 @@ def call_serving_endpoint(
     body: dict = {"messages": messages}
     if max_tokens is not None:
         body["max_tokens"] = max_tokens
+    if stream:
+        body["stream"] = True
+    if response_format is not None:
+        body["response_format"] = response_format
 
     total_chars = sum(len(m.get("content", "")) for m in messages)
     logger.info(f"Calling serving endpoint: {model} (prompt: {total_chars} chars, {len(messages)} messages)")
 
     t0 = time.monotonic()
-    resp = httpx.post(
-        url,
-        json=body,
-        headers=auth_headers,
-        timeout=timeout,
-    )
-    elapsed = time.monotonic() - t0
-    logger.info(f"Serving endpoint responded in {elapsed:.1f}s")
-
-    if resp.status_code == 429:
-        retry_after = resp.headers.get("Retry-After", "unknown")
-        raise RuntimeError(
-            f"Rate limited by serving endpoint (429). Retry-After: {retry_after}s. "
-            "Reduce prompt size or wait before retrying."
+    status_code = None
+    retry_after = None
+    error_text = ""
+
+    for attempt in range(max_retries + 1):
+        content = None
+        if stream:
+            with _http_client.stream(
+                "POST", url, json=body, headers=auth_headers, timeout=timeout
+            ) as resp:
+                status_code = resp.status_code
+                retry_after = resp.headers.get("Retry-After")
+                if status_code == 200:
+                    content = _consume_sse_stream(resp)
+                else:
+                    error_text = resp.read().decode("utf-8", errors="replace")
+        else:
+            resp = _http_client.post(url, json=body, headers=auth_headers, timeout=timeout)
+            status_code = resp.status_code
+            retry_after = resp.headers.get("Retry-After")
+            if status_code == 200:
+                content = _parse_completion_response(resp.json())
+            else:
+                error_text = resp.text
+
+        if status_code == 200:
+            elapsed = time.monotonic() - t0
+            logger.info(f"Serving endpoint responded in {elapsed:.1f}s")
+            if not content:
+                raise ValueError("LLM returned empty content")
+            return content
+
+        if status_code != 429 or attempt >= max_retries:
+            break
+
+        # Honor Retry-After if given, otherwise exponential backoff (2s, 4s)
+        try:
+            wait = min(float(retry_after), 30.0) if retry_after else 2.0 * (2 ** attempt)
+        except ValueError:
+            wait = 2.0 * (2 ** attempt)
+        logger.warning(
+            f"Rate limited (429), retrying in {wait:.0f}s "
+            f"(attempt {attempt + 1}/{max_retries})"
         )
+        time.sleep(wait)
 
-    if resp.status_code != 200:
+    if status_code == 429:
         raise RuntimeError(
-            f"Serving endpoint returned {resp.status_code}: {resp.text[:500]}"
+            f"Rate limited by serving endpoint (429). Retry-After: {retry_after or 'unknown'}s. "
+            "Reduce prompt size or wait before retrying."
         )
 
-    response = resp.json()
-
-    # Response is in OpenAI-compatible format
-    if not isinstance(response, dict):
-        raise ValueError(f"Unexpected response type: {type(response)}")
-
-    if "choices" not in response:
-        logger.error(f"Response missing 'choices': {response}")
-        raise ValueError(f"Response missing 'choices' key: {list(response.keys())}")
-
-    if not response["choices"]:
-        raise ValueError("Response has empty 'choices' list")
-
-    content = response["choices"][0]["message"]["content"]
-    if not content:
-        raise ValueError("LLM returned empty content")
-
-    return content
+    raise RuntimeError(
+        f"Serving endpoint returned {status_code}: {error_text[:500]}"
+    )
 
 
 def _repair_json(content: str) -> str:
@@ -108,8 +196,6 @@ def _repair_json(content: str) -> str:
     - Missing commas between array elements or object properties
     - Trailing commas (not valid JSON but LLMs often add them)
     """
-    import re
-
     # Remove trailing commas before closing brackets/braces
     content = re.sub(r",\s*([}\]])", r"\1", content)
 
@@ -160,16 +246,12 @@ def parse_json_from_llm_response(content: str) -> dict:
 
     # Handle markdown code blocks
     if content.startswith("```"):
-        lines = content.split("\n")
-        # Skip first line (```json or ```)
-        start_idx = 1
-        # Find closing ```
-        end_idx = len(lines)
-        for i in range(len(lines) - 1, 0, -1):
-            if lines[i].strip() == "```":
-                end_idx = i
-                break
-        content = "\n".join(lines[start_idx:end_idx])
+        match = _CODE_FENCE_RE.match(content)
+        if match:
+            content = match.group(1)
+        else:
+            # Unterminated fence: drop the opening line only
+            content = content.split("\n", 1)[1] if "\n" in content else ""
 
     # Handle case where response might have text before JSON
     if not content.startswith("{"):
@@ -192,19 +274,21 @@ def parse_json_from_llm_response(content: str) -> dict:
     if not content:
         raise ValueError("LLM returned empty response after parsing")
 
-    # Try parsing as-is first
+    # Try parsing as-is first (orjson: ~3-5x faster than stdlib json on
+    # the nested evaluation payloads; its JSONDecodeError subclasses the
+    # stdlib one so callers' error handling is unchanged)
     try:
-        return json.loads(content)
-    except json.JSONDecodeError as e:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError as e:
         logger.warning(f"Initial JSON parse failed: {e}. Attempting repair...")
 
         # Try to repair and parse again
         repaired = _repair_json(content)
         try:
-            result = json.loads(repaired)
+            result = orjson.loads(repaired)
             logger.info("JSON repair successful")
             return result
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             # Re-raise original error with context
             logger.error(f"JSON repair failed. Content preview: {content[:500]}...")
             raise e
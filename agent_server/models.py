@@ -90,6 +90,10 @@ class AgentOutput(BaseModel):
     synthesis: SynthesisResult | None = None  # Cross-sectional synthesis (full analysis only)
     overall_score: int  # Kept for backward compatibility
     trace_id: str
+    # Aggregates accumulated while analyses are in hand, so report
+    # generation doesn't re-traverse every finding
+    total_findings: int = 0
+    severity_counts: dict[str, int] = Field(default_factory=dict)
 
 
 # Optimization models
@@ -1,6 +1,9 @@
 """Optimizer module for generating Genie Space optimization suggestions."""
 
+import copy
 import logging
+import re
+from functools import cache
 from pathlib import Path
 
 from agent_server.llm_utils import call_serving_endpoint, get_llm_model, parse_json_from_llm_response
@@ -15,28 +18,26 @@ from agent_server.prompts import get_optimization_prompt
 
 logger = logging.getLogger(__name__)
 
+_DOCS_DIR = Path(__file__).parent.parent / "docs"
+
+
+@cache
+def _get_checklist_content() -> str:
+    """Load the checklist markdown content (read once per process)."""
+    return (_DOCS_DIR / "checklist-by-schema.md").read_text()
+
+
+@cache
+def _get_schema_content() -> str:
+    """Load the Genie Space schema documentation (read once per process)."""
+    return (_DOCS_DIR / "genie-space-schema.md").read_text()
+
 
 class GenieSpaceOptimizer:
     """Generates optimization suggestions for Genie Space configurations."""
 
     def __init__(self):
         self.model = get_llm_model()
-        self._checklist_content: str | None = None
-        self._schema_content: str | None = None
-
-    def _get_checklist_content(self) -> str:
-        """Load the checklist markdown content."""
-        if self._checklist_content is None:
-            checklist_path = Path(__file__).parent.parent / "docs" / "checklist-by-schema.md"
-            self._checklist_content = checklist_path.read_text()
-        return self._checklist_content
-
-    def _get_schema_content(self) -> str:
-        """Load the Genie Space schema documentation."""
-        if self._schema_content is None:
-            schema_path = Path(__file__).parent.parent / "docs" / "genie-space-schema.md"
-            self._schema_content = schema_path.read_text()
-        return self._schema_content
 
     def discover_missing_joins(self, space_data: dict) -> list[dict]:
         """Scan tables for column patterns suggesting undeclared joins.
@@ -139,8 +140,8 @@ class GenieSpaceOptimizer:
             logger.info(f"Found {len(join_candidates)} potential missing join(s)")
 
         # Get checklist and schema content
-        checklist_content = self._get_checklist_content()
-        schema_content = self._get_schema_content()
+        checklist_content = _get_checklist_content()
+        schema_content = _get_schema_content()
 
         # Build the prompt
         prompt = get_optimization_prompt(
@@ -199,9 +200,6 @@ class GenieSpaceOptimizer:
         Returns:
             ConfigMergeResponse with merged config and summary
         """
-        import copy
-        import re
-
         # Deep copy to avoid modifying original
         merged = copy.deepcopy(space_data)
 
@@ -235,8 +233,6 @@ class GenieSpaceOptimizer:
         - "instructions.text_instructions[0].content"
         - "data_sources.tables[2].columns[0].synonyms"
         """
-        import re
-
         # Parse path into segments
         # Split on dots, but handle array indices
         segments = []
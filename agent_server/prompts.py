@@ -1,14 +1,63 @@
 """Prompts for the Genie Space Analyzer agent."""
 
-import json
+import orjson
 
 
-def get_checklist_evaluation_prompt(
+def _to_pretty_json(data: dict | list) -> str:
+    """Serialize prompt payloads with orjson (noticeably faster than stdlib
+    json on the large table/question sections embedded in prompts)."""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
+
+# Invariant evaluation instructions, shared verbatim across every section
+# call. Keeping this identical (and first, as the system message) lets
+# serving stacks with prefix caching reuse the prefill KV across sibling
+# section requests — only the user message varies per section.
+CHECKLIST_EVALUATION_SYSTEM_PROMPT = """You are evaluating a Databricks Genie Space configuration section against specific checklist criteria.
+
+## Instructions:
+For each checklist item, determine if the configuration passes or fails the criterion.
+Be fair but thorough - a check should pass if the configuration reasonably meets the criterion.
+If the section data is empty/null, most quality checks should fail (except those that are N/A).
+
+Output your evaluation as JSON with this exact structure:
+{
+  "evaluations": [
+    {
+      "id": "item_id_here",
+      "passed": true | false,
+      "details": "Brief explanation of why it passed or failed"
+    }
+  ],
+  "findings": [
+    {
+      "category": "best_practice" | "warning" | "suggestion",
+      "severity": "high" | "medium" | "low",
+      "description": "Description of the issue (only for failed items)",
+      "recommendation": "Specific actionable recommendation",
+      "reference": "Related checklist item ID"
+    }
+  ],
+  "summary": "Brief overall summary of the section's compliance"
+}
+
+Only include findings for checklist items that FAILED. Do not create findings for passing items.
+Match finding severity to the importance of the failed check:
+- high: Critical functionality or major best practice violation
+- medium: Recommended practice not followed
+- low: Minor improvement opportunity"""
+
+
+def get_checklist_evaluation_messages(
     section_name: str,
     section_data: dict | list | None,
     checklist_items: list[dict],
-) -> str:
-    """Build the prompt for LLM to evaluate qualitative checklist items.
+) -> list[dict]:
+    """Build the chat messages for LLM evaluation of checklist items.
+
+    The invariant instructions live in the system message; the
+    section-specific content comes last in the user message so the shared
+    prefix is cacheable across section calls.
 
     Args:
         section_name: Name of the section being analyzed
@@ -16,52 +65,65 @@ def get_checklist_evaluation_prompt(
         checklist_items: List of dicts with 'id' and 'description' for each item to evaluate
 
     Returns:
-        The formatted prompt string
+        List of chat messages in OpenAI format
     """
     items_text = "\n".join(
         f"- {item['id']}: {item['description']}"
         for item in checklist_items
     )
 
-    data_json = json.dumps(section_data, indent=2) if section_data else "null (section not configured)"
+    data_json = _to_pretty_json(section_data) if section_data else "null (section not configured)"
 
-    return f"""You are evaluating a Databricks Genie Space configuration section against specific checklist criteria.
+    user_content = f"""## Section: {section_name}
 
-## Section: {section_name}
+## Checklist Items to Evaluate:
+{items_text}
 
 ## Data to Analyze:
 ```json
 {data_json}
-```
+```"""
+
+    return [
+        {"role": "system", "content": CHECKLIST_EVALUATION_SYSTEM_PROMPT},
+        {"role": "user", "content": user_content},
+    ]
 
-## Checklist Items to Evaluate:
-{items_text}
+
+# Invariant instructions for batched evaluation, kept identical across
+# batches for the same prefix-caching reason as the single-section prompt.
+BATCHED_CHECKLIST_EVALUATION_SYSTEM_PROMPT = """You are evaluating multiple Databricks Genie Space configuration sections against specific checklist criteria.
 
 ## Instructions:
-For each checklist item, determine if the configuration passes or fails the criterion.
+For each section, evaluate every one of its checklist items and determine if the configuration passes or fails the criterion.
 Be fair but thorough - a check should pass if the configuration reasonably meets the criterion.
-If the section data is empty/null, most quality checks should fail (except those that are N/A).
-
-Output your evaluation as JSON with this exact structure:
-{{
-  "evaluations": [
-    {{
-      "id": "item_id_here",
-      "passed": true | false,
-      "details": "Brief explanation of why it passed or failed"
-    }}
-  ],
-  "findings": [
-    {{
-      "category": "best_practice" | "warning" | "suggestion",
-      "severity": "high" | "medium" | "low",
-      "description": "Description of the issue (only for failed items)",
-      "recommendation": "Specific actionable recommendation",
-      "reference": "Related checklist item ID"
-    }}
-  ],
-  "summary": "Brief overall summary of the section's compliance"
-}}
+If a section's data is empty/null, most quality checks should fail (except those that are N/A).
+
+Output your evaluation as JSON with this exact structure, one results entry per section, using the [index] numbers from the sections listed in the user message:
+{
+  "results": [
+    {
+      "index": 1,
+      "evaluations": [
+        {
+          "id": "item_id_here",
+          "passed": true | false,
+          "details": "Brief explanation of why it passed or failed"
+        }
+      ],
+      "findings": [
+        {
+          "category": "best_practice" | "warning" | "suggestion",
+          "severity": "high" | "medium" | "low",
+          "description": "Description of the issue (only for failed items)",
+          "recommendation": "Specific actionable recommendation",
+          "reference": "Related checklist item ID"
+        }
+      ],
+      "summary": "Brief overall summary of the section's compliance"
+    }
+  ]
+}
 
 Only include findings for checklist items that FAILED. Do not create findings for passing items.
 Match finding severity to the importance of the failed check:
@@ -70,6 +132,48 @@ Match finding severity to the importance of the failed check:
 - low: Minor improvement opportunity"""
 
 
+def get_batched_checklist_evaluation_messages(
+    sections: list[tuple[str, dict | list, list[dict]]],
+) -> list[dict]:
+    """Build the chat messages evaluating checklist items for several sections.
+
+    Batching sections into one request shares the instruction preamble and
+    avoids paying the per-call round-trip cost once per section.
+
+    Args:
+        sections: List of (section_name, section_data, checklist_items) tuples.
+            Each section is identified by a 1-based [index] in the prompt.
+
+    Returns:
+        List of chat messages in OpenAI format
+    """
+    section_blocks = []
+    for index, (section_name, section_data, checklist_items) in enumerate(sections, 1):
+        items_text = "\n".join(
+            f"- {item['id']}: {item['description']}"
+            for item in checklist_items
+        )
+        data_json = _to_pretty_json(section_data) if section_data else "null (section not configured)"
+        section_blocks.append(
+            f"""### [{index}] Section: {section_name}
+
+Checklist Items to Evaluate:
+{items_text}
+
+Data to Analyze:
+```json
+{data_json}
+```"""
+        )
+
+    sections_text = "\n\n".join(section_blocks)
+
+    return [
+        {"role": "system", "content": BATCHED_CHECKLIST_EVALUATION_SYSTEM_PROMPT},
+        {"role": "user", "content": f"## Sections\n{sections_text}"},
+    ]
+
+
 def get_optimization_prompt(
     space_data: dict,
     labeling_feedback: list[dict],
@@ -144,7 +248,7 @@ Analyze the Genie Space configuration and labeling feedback to generate specific
 
 ## Genie Space Configuration
 ```json
-{json.dumps(space_data, indent=2)}
+{_to_pretty_json(space_data)}
 ```
 
 ## Labeling Feedback
@@ -272,8 +376,8 @@ def get_error_analysis_prompt(
     programmatic_reason: str,
 ) -> str:
     """Build prompt for LLM to compare SQL results semantically."""
-    genie_result_str = json.dumps(genie_result, indent=2) if genie_result else "null"
-    expected_result_str = json.dumps(expected_result, indent=2) if expected_result else "null"
+    genie_result_str = _to_pretty_json(genie_result) if genie_result else "null"
+    expected_result_str = _to_pretty_json(expected_result) if expected_result else "null"
 
     return f"""You are comparing two SQL query results to determine if they answer the same question correctly.
 
@@ -66,6 +66,7 @@ import agent_server.agent
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from mlflow.genai.agent_server import (
@@ -78,7 +79,7 @@ from starlette.responses import Response, StreamingResponse
 
 from agent_server.agent import get_analyzer, save_analysis_output
 from agent_server.api import router as api_router
-from agent_server.auth import is_running_on_databricks_apps, set_obo_token
+from agent_server.auth import get_obo_token, is_running_on_databricks_apps, set_obo_token
 from agent_server.models import AgentInput
 
 
@@ -115,6 +116,28 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         return response
 
 
+# SSE endpoints must bypass compression entirely: the pinned starlette's
+# GZipMiddleware buffers streamed bodies in the compressor without a
+# per-frame flush, which would hold back progress events and the 15s
+# heartbeats until the stream ends (defeating X-Accel-Buffering: no).
+_SSE_PATHS = frozenset({
+    "/api/analyze/stream",
+    "/api/analyze/all",
+    "/api/optimize",
+    "/invocations/stream",
+})
+
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that leaves the SSE routes uncompressed."""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in _SSE_PATHS:
+            await self.app(scope, receive, send)
+        else:
+            await super().__call__(scope, receive, send)
+
+
 agent_server = AgentServer()
 # Define the app as a module level variable to enable multiple workers
 app = agent_server.app  # noqa: F841
@@ -132,6 +155,11 @@ app.add_middleware(OBOAuthMiddleware)
 # Add security headers middleware
 app.add_middleware(SecurityHeadersMiddleware)
 
+# Compress large JSON responses (/space/fetch, /checklist, /analyze results
+# are hundreds of KB of repetitive JSON). The size threshold keeps small
+# responses from paying the CPU cost.
+app.add_middleware(SelectiveGZipMiddleware, minimum_size=4096)
+
 # Add CORS middleware for development only
 # On Databricks Apps, frontend and backend are served from same origin (no CORS needed)
 if not is_running_on_databricks_apps():
@@ -184,8 +212,6 @@ else:
 @app.post("/invocations/stream")
 async def invoke_stream(data: dict):
     """Streaming invocation endpoint that sends progress updates."""
-    from agent_server.auth import get_obo_token
-
     # Capture OBO token before entering the sync generator thread
     captured_token = get_obo_token()
 
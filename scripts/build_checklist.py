@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Generate the checklist JSON sidecar from docs/checklist-by-schema.md.
+
+Runs the markdown parser once at build time and writes the result to
+docs/checklist-by-schema.json so server cold starts can load the items
+with a single orjson parse instead of the regex-based markdown walk.
+
+The sidecar is optional: it records a content hash of the markdown, and
+the server falls back to parsing the markdown whenever the sidecar is
+missing or its hash no longer matches, so editing
+docs/checklist-by-schema.md without rebuilding keeps working.
+
+Usage:
+    uv run python scripts/build_checklist.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import orjson
+
+from agent_server.checklist_parser import (
+    DEFAULT_CHECKLIST_JSON_PATH,
+    checklist_source_hash,
+    parse_checklist_markdown,
+)
+
+
+def main() -> None:
+    items = parse_checklist_markdown()
+    total = sum(len(v) for v in items.values())
+    sidecar = {"source_hash": checklist_source_hash(), "items": items}
+    DEFAULT_CHECKLIST_JSON_PATH.write_bytes(
+        orjson.dumps(sidecar, option=orjson.OPT_INDENT_2) + b"\n"
+    )
+    print(f"Wrote {total} items to {DEFAULT_CHECKLIST_JSON_PATH}")
+
+
+if __name__ == "__main__":
+    main()